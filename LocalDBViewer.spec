@@ -28,8 +28,41 @@ for src, dst in resource_dirs:
 # Collect PySide6 data
 pyside6_data = collect_data_files('PySide6')
 
+# Qt modules the app never imports; bundling them only adds bytes to unpack
+# and load at startup
+UNUSED_QT_MODULES = [
+    'PySide6.QtWebEngineCore',
+    'PySide6.QtWebEngineWidgets',
+    'PySide6.QtWebEngineQuick',
+    'PySide6.QtQml',
+    'PySide6.QtQuick',
+    'PySide6.QtNetwork',
+    'PySide6.QtMultimedia',
+]
+
+# Bundled files the app never loads: Qt's translations other than English and
+# the DirectX shader compiler / software OpenGL fallback (widgets only)
+UNUSED_BINARIES = ('d3dcompiler_47.dll', 'opengl32sw.dll')
+
+
+def is_unused_file(dest):
+    """Return True for bundled files that can be dropped from the EXE."""
+    parts = dest.replace('\\', '/').split('/')
+    name = parts[-1].lower()
+    if name in UNUSED_BINARIES:
+        return True
+    return (
+        'translations' in parts
+        and name.endswith('.qm')
+        and not name.endswith('_en.qm')
+    )
+
+
 # Hidden imports
-hidden_imports = collect_submodules('PySide6')
+hidden_imports = [
+    name for name in collect_submodules('PySide6')
+    if not name.startswith(tuple(UNUSED_QT_MODULES))
+]
 hidden_imports.extend([
     'sqlite3',
 ])
@@ -54,13 +87,18 @@ a = Analysis(
         'pytest',
         'pytest_qt',
         'pytest_cov',
-    ],
+        'test',
+        'unittest',
+    ] + UNUSED_QT_MODULES,
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
     noarchive=False,
 )
 
+a.binaries = [entry for entry in a.binaries if not is_unused_file(entry[0])]
+a.datas = [entry for entry in a.datas if not is_unused_file(entry[0])]
+
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
 
 exe = EXE(
@@ -5,9 +5,10 @@ All database connectors must inherit from BaseConnector and implement
 all abstract methods.
 """
 
+import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 
 
 @dataclass
@@ -45,16 +46,47 @@ class TableSchema:
 class QueryResult:
     """Result of a database query."""
     columns: List[str] = field(default_factory=list)
+    # Rows are fully fetched: the result grid and the export both read the
+    # stored result, and a query is never re-run since it may not be read-only
     rows: List[tuple] = field(default_factory=list)
     row_count: int = 0
     execution_time: float = 0.0
     error: Optional[str] = None
+    # One list of values per column, filled instead of rows for columnar queries
+    column_data: Optional[List[list]] = None
+    # Key of the last row of a table page; pass as `after` to fetch the next page
+    last_key: Optional[tuple] = None
 
     @property
     def success(self) -> bool:
         """Check if query was successful."""
         return self.error is None
 
+    @property
+    def is_columnar(self) -> bool:
+        """Check if values are stored per column in column_data."""
+        return self.column_data is not None
+
+    def iter_rows(self) -> Iterator[tuple]:
+        """Iterate over result rows regardless of the storage layout."""
+        if self.column_data is not None:
+            return zip(*self.column_data)
+        return iter(self.rows)
+
+    def get_column(self, index: int) -> list:
+        """
+        Get all values of one result column.
+
+        Args:
+            index: Column position in columns
+
+        Returns:
+            List of the column's values, one per row
+        """
+        if self.column_data is not None:
+            return self.column_data[index]
+        return [row[index] for row in self.rows]
+
 
 class DatabaseError(Exception):
     """Base exception for database errors."""
@@ -130,6 +162,36 @@ class BaseConnector(ABC):
         """
         pass
 
+    def get_columns(self, table_name: str) -> List[ColumnInfo]:
+        """
+        Get column information for a table without the rest of its schema.
+
+        Args:
+            table_name: Name of the table
+
+        Returns:
+            List of ColumnInfo objects
+        """
+        return self.get_schema(table_name).columns
+
+    def invalidate_schema(self, table_name: Optional[str] = None) -> None:
+        """
+        Drop cached schema information and the table list, e.g. after DDL.
+
+        Args:
+            table_name: Table to invalidate, or None for all tables
+        """
+        pass
+
+    def invalidate_rowcount(self, table_name: Optional[str] = None) -> None:
+        """
+        Drop cached row counts, e.g. after rows were inserted or deleted.
+
+        Args:
+            table_name: Table to invalidate, or None for all tables
+        """
+        pass
+
     @abstractmethod
     def get_table_data(
         self,
@@ -137,7 +199,9 @@ class BaseConnector(ABC):
         offset: int = 0,
         limit: int = 100,
         order_by: Optional[str] = None,
-        order_desc: bool = False
+        order_desc: bool = False,
+        after: Optional[tuple] = None,
+        columnar: bool = False
     ) -> QueryResult:
         """
         Get paginated data from a table.
@@ -148,6 +212,9 @@ class BaseConnector(ABC):
             limit: Maximum number of rows to return
             order_by: Column name to sort by
             order_desc: Sort in descending order if True
+            after: last_key of the previous page; when given, the page is
+                located by key (keyset pagination) and offset is ignored
+            columnar: Return values per column in column_data instead of rows
 
         Returns:
             QueryResult with rows and metadata
@@ -155,13 +222,22 @@ class BaseConnector(ABC):
         pass
 
     @abstractmethod
-    def execute_query(self, query: str, timeout: int = 30) -> QueryResult:
+    def execute_query(
+        self,
+        query: str,
+        timeout: int = 30,
+        columnar: bool = False,
+        cancel: Optional[threading.Event] = None
+    ) -> QueryResult:
         """
         Execute a SQL query.
 
         Args:
             query: SQL query string
             timeout: Query timeout in seconds
+            columnar: Return result values per column in column_data
+                instead of per row in rows
+            cancel: Event that aborts the query when set (optional)
 
         Returns:
             QueryResult with results and metadata
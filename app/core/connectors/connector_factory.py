@@ -2,7 +2,6 @@
 Factory for creating database connectors based on file extension.
 """
 
-from pathlib import Path
 from typing import Dict, List, Type
 
 from .base_connector import BaseConnector, UnsupportedDatabaseError
@@ -29,6 +28,21 @@ class ConnectorFactory:
         # '.accdb': AccessConnector,
     }
 
+    @staticmethod
+    def _get_extension(file_path: str) -> str:
+        """
+        Get the lowercased file extension of a path.
+
+        Same result as Path(file_path).suffix.lower() without building a
+        Path object.
+        """
+        dot = file_path.rfind('.')
+        sep = max(file_path.rfind('/'), file_path.rfind('\\'))
+        # No dot in the file name, a dot-file like ".db", or a trailing dot
+        if dot <= sep + 1 or dot == len(file_path) - 1:
+            return ''
+        return file_path[dot:].lower()
+
     @classmethod
     def create_connector(cls, file_path: str) -> BaseConnector:
         """
@@ -43,7 +57,7 @@ class ConnectorFactory:
         Raises:
             UnsupportedDatabaseError: If file extension is not supported
         """
-        ext = Path(file_path).suffix.lower()
+        ext = cls._get_extension(file_path)
 
         if ext not in cls._connectors:
             supported = ', '.join(cls.get_supported_extensions())
@@ -107,7 +121,7 @@ class ConnectorFactory:
         Returns:
             True if file type is supported
         """
-        ext = Path(file_path).suffix.lower()
+        ext = cls._get_extension(file_path)
         return ext in cls._connectors
 
     @classmethod
@@ -2,10 +2,17 @@
 SQLite database connector implementation.
 """
 
+import functools
+import itertools
+import os
+import queue
+import re
 import sqlite3
+import threading
 import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from .base_connector import (
     BaseConnector,
@@ -25,9 +32,52 @@ class SQLiteConnector(BaseConnector):
 
     SUPPORTED_EXTENSIONS = ['.db', '.sqlite', '.sqlite3']
 
+    # Per-connection tuning for a read-heavy viewer
+    CONNECTION_PRAGMAS = (
+        "PRAGMA synchronous = NORMAL",
+        "PRAGMA temp_store = MEMORY",
+        "PRAGMA cache_size = -131072",
+        "PRAGMA mmap_size = 268435456",
+        "PRAGMA busy_timeout = 30000",
+    )
+
+    # Prepared statements kept per connection (sqlite3 default is 128)
+    STATEMENT_CACHE_SIZE = 512
+
+    # Maximum number of pooled read-only connections
+    READ_POOL_SIZE = min(os.cpu_count() or 1, 4)
+
+    # Maximum number of cached table schemas
+    SCHEMA_CACHE_SIZE = 256
+
+    # Rows fetched per batch when building columnar results
+    FETCH_BATCH_SIZE = 1000
+
+    # Names under which SQLite exposes the rowid of a table
+    ROWID_ALIASES = ('rowid', '_rowid_', 'oid')
+
+    _WITHOUT_ROWID = re.compile(r'\bWITHOUT\s+ROWID\b', re.IGNORECASE)
+
+    # VM instructions between deadline checks while a statement runs
+    PROGRESS_INTERVAL = 10000
+
+    CANCELLED_ERROR = "Query cancelled"
+
     def __init__(self):
         self._connection: Optional[sqlite3.Connection] = None
         self._file_path: Optional[str] = None
+        # Single writer; readers are checked out of the pool
+        self._write_lock = threading.Lock()
+        self._pool_lock = threading.Lock()
+        self._read_pool: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        self._readers_open = 0
+        self._read_pool_enabled = True
+        # Metadata caches keyed by the file's data version (see _data_version)
+        self._schema_cache = functools.lru_cache(maxsize=self.SCHEMA_CACHE_SIZE)(
+            self._load_schema
+        )
+        self._row_counts: Dict[str, Tuple[tuple, int]] = {}
+        self._tables: Optional[Tuple[tuple, List[str]]] = None
 
     def connect(self, file_path: str) -> bool:
         """Connect to a SQLite database file."""
@@ -50,40 +100,174 @@ class SQLiteConnector(BaseConnector):
             self._connection = sqlite3.connect(
                 file_path,
                 check_same_thread=False,
-                timeout=30.0
+                timeout=30.0,
+                cached_statements=self.STATEMENT_CACHE_SIZE
             )
             # Enable foreign key support
             self._connection.execute("PRAGMA foreign_keys = ON")
+            self._apply_pragmas(self._connection)
+
+            # Read the header now so files that are not databases fail here.
+            # The journal mode is left as is: it is stored in the file, and
+            # switching to WAL would change the user's database for good
+            self._connection.execute("PRAGMA schema_version")
+
             self._file_path = file_path
             return True
 
         except sqlite3.Error as e:
+            if self._connection:
+                self._connection.close()
+                self._connection = None
             raise ConnectionError(f"Failed to connect to database: {e}")
 
-    def disconnect(self) -> None:
-        """Close the database connection."""
-        if self._connection:
+    def open_readonly(self) -> sqlite3.Connection:
+        """
+        Open an additional read-only connection to the current database.
+
+        mode=ro only covers the main database file; query_only also rejects
+        writes to temp tables and attached databases, which would otherwise
+        succeed on a pooled reader and then silently live on that connection.
+
+        Returns:
+            New sqlite3 connection opened with mode=ro and query_only
+
+        Raises:
+            ConnectionError: If not connected or the connection fails
+        """
+        if not self._file_path:
+            raise ConnectionError("Not connected to database")
+
+        uri = Path(self._file_path).resolve().as_uri() + "?mode=ro"
+        try:
+            connection = sqlite3.connect(
+                uri,
+                uri=True,
+                check_same_thread=False,
+                timeout=30.0,
+                cached_statements=self.STATEMENT_CACHE_SIZE
+            )
+            self._apply_pragmas(connection)
+            connection.execute("PRAGMA query_only = ON")
+            return connection
+
+        except sqlite3.Error as e:
+            raise ConnectionError(f"Failed to open read-only connection: {e}")
+
+    def _apply_pragmas(self, connection: sqlite3.Connection) -> None:
+        """Apply the per-connection tuning PRAGMAs."""
+        for pragma in self.CONNECTION_PRAGMAS:
+            connection.execute(pragma)
+
+    @contextmanager
+    def _checkout_reader(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrow a read-only connection from the pool.
+
+        Connections are opened lazily up to READ_POOL_SIZE. If read-only
+        connections cannot be opened, the main connection is used instead.
+        """
+        pool = self._read_pool
+        try:
+            connection = pool.get_nowait()
+        except queue.Empty:
+            connection = None
+            with self._pool_lock:
+                if self._read_pool_enabled and self._readers_open < self.READ_POOL_SIZE:
+                    try:
+                        connection = self.open_readonly()
+                        self._readers_open += 1
+                    except ConnectionError:
+                        self._read_pool_enabled = False
+
+            if connection is None:
+                if self._readers_open == 0:
+                    # No pooled readers available at all - use the writer
+                    with self._write_lock:
+                        yield self._connection
+                    return
+                connection = pool.get()
+
+        try:
+            yield connection
+        finally:
+            pool.put(connection)
+
+    def _close_read_pool(self) -> None:
+        """Close all pooled read-only connections."""
+        with self._pool_lock:
+            pool = self._read_pool
+            self._read_pool = queue.Queue()
+            self._readers_open = 0
+            self._read_pool_enabled = True
+
+        while True:
             try:
-                self._connection.close()
+                pool.get_nowait().close()
+            except queue.Empty:
+                break
             except sqlite3.Error:
                 pass
-            finally:
-                self._connection = None
-                self._file_path = None
+
+    def _data_version(self) -> tuple:
+        """
+        Get a token that changes whenever the database file is modified.
+
+        Combines mtime and size of the main file and its WAL file, since
+        committed WAL transactions do not touch the main file until checkpoint.
+        """
+        version = []
+        for suffix in ("", "-wal"):
+            try:
+                stat = os.stat(self._file_path + suffix)
+                version.extend((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                version.extend((0, 0))
+        return tuple(version)
+
+    def _clear_caches(self) -> None:
+        """Drop all cached metadata."""
+        self._schema_cache.cache_clear()
+        self._row_counts.clear()
+        self._tables = None
+
+    def disconnect(self) -> None:
+        """Close the database connection."""
+        self._close_read_pool()
+        self._clear_caches()
+        if self._connection:
+            # A query may still be running on a worker thread; abort it and
+            # wait for it to release the connection before closing it
+            self._connection.interrupt()
+            with self._write_lock:
+                try:
+                    self._connection.close()
+                except sqlite3.Error:
+                    pass
+                finally:
+                    self._connection = None
+                    self._file_path = None
 
     def get_tables(self) -> List[str]:
         """Get list of table names in the database."""
         if not self._connection:
             return []
 
+        version = self._data_version()
+        if self._tables is not None and self._tables[0] == version:
+            return list(self._tables[1])
+
         try:
-            cursor = self._connection.cursor()
-            cursor.execute("""
-                SELECT name FROM sqlite_master
-                WHERE type='table' AND name NOT LIKE 'sqlite_%'
-                ORDER BY name
-            """)
-            return [row[0] for row in cursor.fetchall()]
+            with self._checkout_reader() as connection:
+                cursor = connection.cursor()
+                cursor.execute("""
+                    SELECT name FROM sqlite_master
+                    WHERE type='table' AND name NOT LIKE 'sqlite_%'
+                    ORDER BY name
+                """)
+                tables = [row[0] for row in cursor.fetchall()]
+                self._tables = (version, tables)
+                return list(tables)
 
         except sqlite3.Error as e:
             raise QueryError(f"Failed to get tables: {e}")
@@ -93,66 +277,116 @@ class SQLiteConnector(BaseConnector):
         if not self._connection:
             raise QueryError("Not connected to database")
 
+        return self._schema_cache(table_name, self._data_version())
+
+    def get_columns(self, table_name: str) -> List[ColumnInfo]:
+        """Get column information for a table (foreign keys not resolved)."""
+        if not self._connection:
+            raise QueryError("Not connected to database")
+
         try:
-            cursor = self._connection.cursor()
-
-            # Get column information
-            cursor.execute(f"PRAGMA table_info('{table_name}')")
-            columns = []
-            primary_keys = []
-
-            for row in cursor.fetchall():
-                cid, name, data_type, notnull, default_value, pk = row
-                column = ColumnInfo(
-                    name=name,
-                    data_type=data_type or "BLOB",
-                    nullable=not notnull,
-                    default_value=default_value,
-                    is_primary_key=bool(pk),
-                )
-                columns.append(column)
-                if pk:
-                    primary_keys.append(name)
-
-            # Get foreign key information
-            cursor.execute(f"PRAGMA foreign_key_list('{table_name}')")
-            foreign_keys = []
-            for row in cursor.fetchall():
-                fk_id, seq, ref_table, from_col, to_col, on_update, on_delete, match = row
-                foreign_keys.append({
-                    'column': from_col,
-                    'ref_table': ref_table,
-                    'ref_column': to_col,
-                })
-                # Update column with FK info
-                for col in columns:
-                    if col.name == from_col:
-                        col.foreign_key = f"{ref_table}.{to_col}"
-
-            # Get index information
-            cursor.execute(f"PRAGMA index_list('{table_name}')")
-            indexes = []
-            for row in cursor.fetchall():
-                idx_seq, idx_name, is_unique, origin, partial = row
-                # Get columns in this index
-                cursor.execute(f"PRAGMA index_info('{idx_name}')")
-                idx_columns = [r[2] for r in cursor.fetchall()]
-                indexes.append(IndexInfo(
-                    name=idx_name,
-                    columns=idx_columns,
-                    is_unique=bool(is_unique),
-                ))
-
-            # Get row count
-            row_count = self.get_row_count(table_name)
-
-            # Get DDL
-            cursor.execute(
-                "SELECT sql FROM sqlite_master WHERE type='table' AND name=?",
-                (table_name,)
+            with self._checkout_reader() as connection:
+                rows = connection.execute(
+                    'SELECT name, type, "notnull", dflt_value, pk FROM pragma_table_info(?)',
+                    (table_name,)
+                ).fetchall()
+
+        except sqlite3.Error as e:
+            raise QueryError(f"Failed to get columns for {table_name}: {e}")
+
+        return [
+            ColumnInfo(
+                name=name,
+                data_type=data_type or "BLOB",
+                nullable=not notnull,
+                default_value=default_value,
+                is_primary_key=bool(pk),
             )
-            ddl_row = cursor.fetchone()
-            ddl = ddl_row[0] if ddl_row else ""
+            for name, data_type, notnull, default_value, pk in rows
+        ]
+
+    def invalidate_schema(self, table_name: Optional[str] = None) -> None:
+        """Drop cached schema information for one table or all tables."""
+        # lru_cache cannot evict single entries
+        self._schema_cache.cache_clear()
+        self._tables = None
+        self.invalidate_rowcount(table_name)
+
+    def invalidate_rowcount(self, table_name: Optional[str] = None) -> None:
+        """Drop cached row counts for one table or all tables."""
+        if table_name is None:
+            self._row_counts.clear()
+        else:
+            self._row_counts.pop(table_name, None)
+
+    def _load_schema(self, table_name: str, version: tuple) -> TableSchema:
+        """Read schema information for a table (cached per data version)."""
+        try:
+            with self._checkout_reader() as connection:
+                cursor = connection.cursor()
+
+                # Get columns with their foreign keys already associated
+                cursor.execute("""
+                    SELECT ti.name, ti.type, ti."notnull", ti.dflt_value, ti.pk,
+                           fk."table", fk."to"
+                    FROM pragma_table_info(?) AS ti
+                    LEFT JOIN pragma_foreign_key_list(?) AS fk ON fk."from" = ti.name
+                    ORDER BY ti.cid
+                """, (table_name, table_name))
+                columns = []
+                primary_keys = []
+                foreign_keys = []
+                column = None
+
+                for name, data_type, notnull, default_value, pk, ref_table, to_col in cursor:
+                    # A column referencing several tables spans several rows
+                    if column is None or column.name != name:
+                        column = ColumnInfo(
+                            name=name,
+                            data_type=data_type or "BLOB",
+                            nullable=not notnull,
+                            default_value=default_value,
+                            is_primary_key=bool(pk),
+                        )
+                        columns.append(column)
+                        if pk:
+                            primary_keys.append(name)
+
+                    if ref_table is not None:
+                        foreign_keys.append({
+                            'column': name,
+                            'ref_table': ref_table,
+                            'ref_column': to_col,
+                        })
+                        column.foreign_key = f"{ref_table}.{to_col}"
+
+                # Get indexes and their columns in a single query
+                cursor.execute("""
+                    SELECT il.seq, il.name, il."unique", ii.name
+                    FROM pragma_index_list(?) AS il
+                    LEFT JOIN pragma_index_info(il.name) AS ii
+                    ORDER BY il.seq, ii.seqno
+                """, (table_name,))
+                indexes = []
+                for (idx_seq, idx_name, is_unique), idx_rows in itertools.groupby(
+                    cursor.fetchall(), key=lambda r: r[:3]
+                ):
+                    indexes.append(IndexInfo(
+                        name=idx_name,
+                        columns=[r[3] for r in idx_rows],
+                        is_unique=bool(is_unique),
+                    ))
+
+                # Get row count
+                row_count = self._count_rows(cursor, table_name, version)
+
+                # Get DDL
+                cursor.execute(
+                    "SELECT sql FROM sqlite_master WHERE type='table' AND name=?",
+                    (table_name,)
+                )
+                ddl_row = cursor.fetchone()
+                ddl = ddl_row[0] if ddl_row else ""
 
             return TableSchema(
                 name=table_name,
@@ -173,12 +407,24 @@ class SQLiteConnector(BaseConnector):
         offset: int = 0,
         limit: int = 100,
         order_by: Optional[str] = None,
-        order_desc: bool = False
+        order_desc: bool = False,
+        after: Optional[tuple] = None,
+        columnar: bool = False
     ) -> QueryResult:
         """Get paginated data from a table."""
         if not self._connection:
             raise QueryError("Not connected to database")
 
+        key = self._get_seek_key(table_name)
+        # Row values compare NULL as unknown, so only NOT NULL sort columns
+        # can be combined with the key for seeking
+        if key and order_by and not self._is_not_null(table_name, order_by):
+            key = None
+        if key:
+            return self._get_table_page(
+                table_name, key, offset, limit, after, columnar, order_by, order_desc
+            )
+
         # Build query with proper escaping
         query = f'SELECT * FROM "{table_name}"'
 
@@ -188,26 +434,214 @@ class SQLiteConnector(BaseConnector):
 
         query += f" LIMIT {limit} OFFSET {offset}"
 
-        return self.execute_query(query)
+        with self._checkout_reader() as connection:
+            return self._execute(connection, query, columnar=columnar)
+
+    def _is_not_null(self, table_name: str, column_name: str) -> bool:
+        """Check whether a column can never hold NULL."""
+        schema = self.get_schema(table_name)
+        for column in schema.columns:
+            if column.name == column_name:
+                # An INTEGER PRIMARY KEY is the rowid and never NULL
+                return not column.nullable or (
+                    schema.primary_keys == [column_name]
+                    and column.data_type.upper() == "INTEGER"
+                )
+        return False
+
+    def _get_seek_key(self, table_name: str) -> Optional[Tuple[List[str], bool]]:
+        """
+        Get the unique ordering key used for keyset pagination.
+
+        Returns:
+            Tuple of (key columns, whether the key is a hidden rowid that must
+            be selected in addition to *), or None if the table cannot be
+            paged by key (e.g. views)
+        """
+        try:
+            schema = self.get_schema(table_name)
+        except QueryError:
+            return None
+
+        # Views have no DDL in the tables list and no rowid to seek on
+        if not schema.ddl:
+            return None
+
+        if self._WITHOUT_ROWID.search(schema.ddl):
+            return (schema.primary_keys, False) if schema.primary_keys else None
+
+        # An INTEGER PRIMARY KEY column is an alias for the rowid
+        if len(schema.primary_keys) == 1:
+            pk = schema.primary_keys[0]
+            pk_type = next(c.data_type for c in schema.columns if c.name == pk)
+            if pk_type.upper() == "INTEGER":
+                return [pk], False
+
+        column_names = {c.name.lower() for c in schema.columns}
+        for alias in self.ROWID_ALIASES:
+            if alias not in column_names:
+                return [alias], True
 
-    def execute_query(self, query: str, timeout: int = 30) -> QueryResult:
+        return None
+
+    def _get_table_page(
+        self,
+        table_name: str,
+        key: Tuple[List[str], bool],
+        offset: int,
+        limit: int,
+        after: Optional[tuple],
+        columnar: bool = False,
+        order_by: Optional[str] = None,
+        order_desc: bool = False
+    ) -> QueryResult:
+        """Get a page of table data ordered by a sort column and/or its unique key."""
+        key_columns, hidden = key
+        # The unique key breaks ties between equal sort column values
+        sort_columns = list(key_columns)
+        if order_by:
+            sort_columns = [order_by] + [c for c in key_columns if c != order_by]
+        sort_list = ", ".join(f'"{c}"' for c in sort_columns)
+        direction = "DESC" if order_desc else "ASC"
+
+        select_list = f"*, {key_columns[0]}" if hidden else "*"
+        query = f'SELECT {select_list} FROM "{table_name}"'
+        params: tuple = ()
+
+        if after is not None:
+            placeholders = ", ".join("?" for _ in sort_columns)
+            operator = "<" if order_desc else ">"
+            query += f" WHERE ({sort_list}) {operator} ({placeholders})"
+            params = tuple(after)
+            offset = 0
+
+        order_list = ", ".join(f'"{c}" {direction}' for c in sort_columns)
+        query += f" ORDER BY {order_list} LIMIT {int(limit)} OFFSET {int(offset)}"
+
+        with self._checkout_reader() as connection:
+            result = self._execute(connection, query, columnar=columnar, params=params)
+
+        if not result.success:
+            return result
+
+        # The hidden rowid is selected as the last column
+        last = len(result.columns) - 1
+        positions = [
+            last if hidden and c == key_columns[0] else result.columns.index(c)
+            for c in sort_columns
+        ]
+
+        if result.column_data is not None:
+            if result.row_count:
+                result.last_key = tuple(result.column_data[i][-1] for i in positions)
+            if hidden:
+                result.column_data.pop()
+        elif result.rows:
+            last_row = result.rows[-1]
+            result.last_key = tuple(last_row[i] for i in positions)
+            if hidden:
+                result.rows = [row[:-1] for row in result.rows]
+
+        if hidden:
+            result.columns = result.columns[:-1]
+
+        return result
+
+    def execute_query(
+        self,
+        query: str,
+        timeout: int = 30,
+        columnar: bool = False,
+        cancel: Optional[threading.Event] = None
+    ) -> QueryResult:
         """Execute a SQL query."""
         if not self._connection:
             return QueryResult(error="Not connected to database")
 
+        with self._write_lock:
+            # Disconnected while waiting for the lock
+            connection = self._connection
+            if connection is None:
+                return QueryResult(error="Not connected to database")
+
+            changes = connection.total_changes
+            result = self._execute(connection, query, timeout, columnar, cancel=cancel)
+            # Counts are also keyed by file version, but coarse mtimes on
+            # some file systems can miss a same-size UPDATE/DELETE
+            if connection.total_changes != changes:
+                self.invalidate_rowcount()
+            return result
+
+    def _execute(
+        self,
+        connection: sqlite3.Connection,
+        query: str,
+        timeout: int = 30,
+        columnar: bool = False,
+        params: tuple = (),
+        cancel: Optional[threading.Event] = None
+    ) -> QueryResult:
+        """Execute a SQL query on the given connection."""
         start_time = time.time()
 
+        # Cancelled while waiting for the connection
+        if cancel is not None and cancel.is_set():
+            return QueryResult(error=self.CANCELLED_ERROR)
+
+        # Reject unterminated strings, comments and trigger bodies up front;
+        # the newline keeps a trailing "--" comment from hiding the terminator
+        if not sqlite3.complete_statement(query + "\n;"):
+            return QueryResult(
+                execution_time=time.time() - start_time,
+                error="Incomplete SQL statement",
+            )
+
+        # busy_timeout only bounds lock waits; the progress handler aborts
+        # statements (including their fetch) that run past the deadline or
+        # are cancelled
+        deadline = time.monotonic() + timeout
+        if cancel is not None:
+            if timeout > 0:
+                connection.set_progress_handler(
+                    lambda: cancel.is_set() or time.monotonic() > deadline,
+                    self.PROGRESS_INTERVAL
+                )
+            else:
+                connection.set_progress_handler(cancel.is_set, self.PROGRESS_INTERVAL)
+        elif timeout > 0:
+            connection.set_progress_handler(
+                lambda: time.monotonic() > deadline, self.PROGRESS_INTERVAL
+            )
+
         try:
             # Set timeout
-            self._connection.execute(f"PRAGMA busy_timeout = {timeout * 1000}")
+            connection.execute(f"PRAGMA busy_timeout = {timeout * 1000}")
+
+            cursor = connection.cursor()
+            cursor.execute(query, params)
+
+            # Statements that return rows (SELECT, PRAGMA, ... RETURNING) have a description
+            description = cursor.description
+            if description is not None:
+                columns = [desc[0] for desc in description]
 
-            cursor = self._connection.cursor()
-            cursor.execute(query)
+                if columnar:
+                    column_data, row_count = self._fetch_columns(cursor, len(columns))
+                    if connection.in_transaction:
+                        connection.commit()
+                    execution_time = time.time() - start_time
+
+                    return QueryResult(
+                        columns=columns,
+                        column_data=column_data,
+                        row_count=row_count,
+                        execution_time=execution_time,
+                    )
 
-            # Check if it's a SELECT query
-            if query.strip().upper().startswith("SELECT"):
-                columns = [desc[0] for desc in cursor.description] if cursor.description else []
                 rows = cursor.fetchall()
+                # DML with RETURNING also yields rows and still has to be committed
+                if connection.in_transaction:
+                    connection.commit()
                 execution_time = time.time() - start_time
 
                 return QueryResult(
@@ -218,7 +652,7 @@ class SQLiteConnector(BaseConnector):
                 )
             else:
                 # For non-SELECT queries (INSERT, UPDATE, DELETE)
-                self._connection.commit()
+                connection.commit()
                 execution_time = time.time() - start_time
 
                 return QueryResult(
@@ -230,25 +664,70 @@ class SQLiteConnector(BaseConnector):
 
         except sqlite3.Error as e:
             execution_time = time.time() - start_time
+            error = str(e)
+            if error == "interrupted":
+                if cancel is not None and cancel.is_set():
+                    error = self.CANCELLED_ERROR
+                elif timeout > 0 and time.monotonic() > deadline:
+                    error = f"Query timed out after {timeout} seconds"
             return QueryResult(
                 execution_time=execution_time,
-                error=str(e),
+                error=error,
             )
 
+        finally:
+            try:
+                connection.set_progress_handler(None, 0)
+            except sqlite3.ProgrammingError:
+                # The connection was closed while the statement ran
+                pass
+
+    def _fetch_columns(self, cursor: sqlite3.Cursor, column_count: int) -> Tuple[List[list], int]:
+        """
+        Fetch all remaining rows of a cursor as per-column value lists.
+
+        Rows are transposed one batch at a time so the full row list is
+        never materialized.
+        """
+        column_data = [[] for _ in range(column_count)]
+        row_count = 0
+
+        cursor.arraysize = self.FETCH_BATCH_SIZE
+        while True:
+            batch = cursor.fetchmany()
+            if not batch:
+                break
+            row_count += len(batch)
+            for column, values in zip(column_data, zip(*batch)):
+                column.extend(values)
+
+        return column_data, row_count
+
     def get_row_count(self, table_name: str) -> int:
         """Get total row count for a table."""
         if not self._connection:
             return 0
 
+        version = self._data_version()
+        cached = self._row_counts.get(table_name)
+        if cached and cached[0] == version:
+            return cached[1]
+
         try:
-            cursor = self._connection.cursor()
-            cursor.execute(f'SELECT COUNT(*) FROM "{table_name}"')
-            result = cursor.fetchone()
-            return result[0] if result else 0
+            with self._checkout_reader() as connection:
+                return self._count_rows(connection.cursor(), table_name, version)
 
         except sqlite3.Error:
             return 0
 
+    def _count_rows(self, cursor: sqlite3.Cursor, table_name: str, version: tuple) -> int:
+        """Count table rows using an already checked-out cursor."""
+        cursor.execute(f'SELECT COUNT(*) FROM "{table_name}"')
+        result = cursor.fetchone()
+        count = result[0] if result else 0
+        self._row_counts[table_name] = (version, count)
+        return count
+
     @property
     def is_connected(self) -> bool:
         """Check if connected to a database."""
@@ -270,13 +749,14 @@ class SQLiteConnector(BaseConnector):
             return []
 
         try:
-            cursor = self._connection.cursor()
-            cursor.execute("""
-                SELECT name FROM sqlite_master
-                WHERE type='view'
-                ORDER BY name
-            """)
-            return [row[0] for row in cursor.fetchall()]
+            with self._checkout_reader() as connection:
+                cursor = connection.cursor()
+                cursor.execute("""
+                    SELECT name FROM sqlite_master
+                    WHERE type='view'
+                    ORDER BY name
+                """)
+                return [row[0] for row in cursor.fetchall()]
 
         except sqlite3.Error:
             return []
@@ -287,23 +767,14 @@ class SQLiteConnector(BaseConnector):
             return {}
 
         try:
-            cursor = self._connection.cursor()
-
-            # Get SQLite version
-            cursor.execute("SELECT sqlite_version()")
-            version = cursor.fetchone()[0]
-
-            # Get page size
-            cursor.execute("PRAGMA page_size")
-            page_size = cursor.fetchone()[0]
-
-            # Get page count
-            cursor.execute("PRAGMA page_count")
-            page_count = cursor.fetchone()[0]
-
-            # Get encoding
-            cursor.execute("PRAGMA encoding")
-            encoding = cursor.fetchone()[0]
+            with self._checkout_reader() as connection:
+                # Version, page size, page count and encoding in one round trip
+                version, page_size, page_count, encoding = connection.execute(
+                    "SELECT sqlite_version(),"
+                    " (SELECT page_size FROM pragma_page_size()),"
+                    " (SELECT page_count FROM pragma_page_count()),"
+                    " (SELECT encoding FROM pragma_encoding())"
+                ).fetchone()
 
             return {
                 'sqlite_version': version,
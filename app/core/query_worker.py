@@ -0,0 +1,55 @@
+"""
+Background worker for running blocking database calls off the UI thread.
+"""
+
+from typing import Any, Callable
+
+from PySide6.QtCore import QObject, QRunnable, Signal, Slot
+
+
+class WorkerSignals(QObject):
+    """
+    Signals emitted by a QueryWorker.
+
+    The signals object is created on the UI thread, so connected slots of
+    UI widgets are invoked there through queued connections.
+    """
+
+    result = Signal(object)
+    error = Signal(str)
+    finished = Signal()
+    progress = Signal(int)
+
+
+class QueryWorker(QRunnable):
+    """
+    Runs a callable on a QThreadPool thread and reports back through signals.
+
+    Usage:
+        worker = QueryWorker(connector.get_row_count, table_name)
+        worker.signals.result.connect(self._on_row_count)
+        QThreadPool.globalInstance().start(worker)
+
+    Connect bound methods of QObjects (not lambdas) so the slots run on the
+    receiver's thread. Callables that report progress can be handed
+    worker.signals.progress.emit as their callback.
+    """
+
+    def __init__(self, fn: Callable[..., Any], *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+    @Slot()
+    def run(self):
+        """Run the callable and emit its result or error, then finished."""
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.result.emit(result)
+        finally:
+            self.signals.finished.emit()
@@ -2,17 +2,61 @@
 Query history database for storing executed queries.
 """
 
+import atexit
+import queue
+import re
 import sqlite3
 import logging
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass, asdict
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Per-connection PRAGMAs applied to every pooled connection
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA busy_timeout = 5000",
+    "PRAGMA cache_size = -65536",
+    "PRAGMA foreign_keys = ON",
+)
 
-@dataclass
+# Full-text index over query_text, kept in sync with query_history by triggers
+FTS_SCHEMA = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS query_history_fts USING fts5(
+        query_text, content='query_history', content_rowid='id'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS query_history_ai AFTER INSERT ON query_history BEGIN
+        INSERT INTO query_history_fts(rowid, query_text) VALUES (new.id, new.query_text);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS query_history_ad AFTER DELETE ON query_history BEGIN
+        INSERT INTO query_history_fts(query_history_fts, rowid, query_text)
+        VALUES ('delete', old.id, old.query_text);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS query_history_au AFTER UPDATE ON query_history BEGIN
+        INSERT INTO query_history_fts(query_history_fts, rowid, query_text)
+        VALUES ('delete', old.id, old.query_text);
+        INSERT INTO query_history_fts(rowid, query_text) VALUES (new.id, new.query_text);
+    END
+    """,
+)
+
+# Word characters, matching the tokens produced by FTS5's unicode61 tokenizer
+_SEARCH_TOKEN = re.compile(r"\w+")
+
+
+@dataclass(slots=True)
 class QueryRecord:
     """Query history record."""
     id: Optional[int] = None
@@ -29,6 +73,20 @@ class QueryRecord:
         return asdict(self)
 
 
+def _record_factory(cursor: sqlite3.Cursor, row: tuple) -> QueryRecord:
+    """Row factory building QueryRecord objects from query_history rows."""
+    # Timestamps are stored as epoch nanoseconds and exposed as ISO strings
+    return QueryRecord(
+        row[0], row[1], row[2], datetime.fromtimestamp(row[3] / 1e9).isoformat(),
+        row[4], row[5], bool(row[6]), row[7]
+    )
+
+
+def _timestamp_ns(timestamp: str) -> int:
+    """Convert an ISO timestamp string to epoch nanoseconds."""
+    return int(datetime.fromisoformat(timestamp).timestamp() * 1_000_000) * 1000
+
+
 class QueryHistoryDB:
     """
     SQLite database for storing query history.
@@ -40,8 +98,25 @@ class QueryHistoryDB:
     - Row count
     - Success status
     - Error message (if any)
+
+    Keeps one long-lived writer connection (serialized by a lock) and a
+    small pool of reader connections instead of reconnecting per call.
+    New records are buffered and written in batches (see flush()).
     """
 
+    READER_POOL_SIZE = 2
+
+    # Buffered records are flushed after this many seconds or records
+    FLUSH_INTERVAL = 0.5
+    FLUSH_BATCH_SIZE = 100
+
+    INSERT_SQL = (
+        "INSERT INTO query_history ("
+        "database_path, query_text, timestamp, "
+        "execution_time, row_count, success, error_message"
+        ") VALUES (?, ?, ?, ?, ?, ?, ?)"
+    )
+
     def __init__(self, db_path: Optional[str] = None):
         if db_path is None:
             # Default to data directory
@@ -50,26 +125,66 @@ class QueryHistoryDB:
             db_path = str(data_dir / "query_history.db")
 
         self.db_path = db_path
+        self._writer: Optional[sqlite3.Connection] = None
+        self._writer_cursor: Optional[sqlite3.Cursor] = None
+        self._write_lock = threading.Lock()
+        self._readers: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        self._pending: List[tuple] = []
+        self._pending_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+        self._fts_enabled = False
         self._ensure_db_exists()
+        atexit.register(self.close)
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open a pooled connection with the standard PRAGMAs applied."""
+        # Autocommit mode; transactions are managed explicitly in _write()
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    @contextmanager
+    def _read(self) -> Iterator[sqlite3.Connection]:
+        """Check a reader connection out of the pool."""
+        if self._writer is None:
+            raise sqlite3.OperationalError("Query history database is not available")
+
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        """Run the block in a BEGIN IMMEDIATE transaction on the writer connection."""
+        with self._write_lock:
+            conn = self._writer
+            if conn is None:
+                raise sqlite3.OperationalError("Query history database is not available")
+
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            conn.execute("COMMIT")
 
     def _ensure_db_exists(self):
         """Create database and tables if they don't exist."""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._open_connection()
+            conn.execute("PRAGMA journal_mode = WAL")
             cursor = conn.cursor()
 
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS query_history (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    database_path TEXT NOT NULL,
-                    query_text TEXT NOT NULL,
-                    timestamp TEXT NOT NULL,
-                    execution_time REAL DEFAULT 0.0,
-                    row_count INTEGER DEFAULT 0,
-                    success INTEGER DEFAULT 1,
-                    error_message TEXT DEFAULT ''
-                )
-            ''')
+            self._create_table(cursor, "query_history")
+            self._migrate_timestamps(cursor)
 
             # Create indexes
             cursor.execute('''
@@ -82,62 +197,201 @@ class QueryHistoryDB:
                 ON query_history(database_path)
             ''')
 
-            conn.commit()
-            conn.close()
+            self._fts_enabled = self._create_fts(cursor)
+
+            self._writer = conn
+            self._writer_cursor = conn.cursor()
+            for _ in range(self.READER_POOL_SIZE):
+                self._readers.put(self._open_connection())
 
             logger.info(f"Query history database initialized: {self.db_path}")
 
         except sqlite3.Error as e:
             logger.error(f"Failed to initialize query history database: {e}")
 
-    def add_query(self, record: QueryRecord) -> int:
+    @staticmethod
+    def _create_table(cursor: sqlite3.Cursor, name: str):
+        """Create the history table under the given name."""
+        # timestamp holds epoch nanoseconds so ordering is an integer compare
+        cursor.execute(f'''
+            CREATE TABLE IF NOT EXISTS {name} (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                database_path TEXT NOT NULL,
+                query_text TEXT NOT NULL,
+                timestamp INTEGER NOT NULL,
+                execution_time REAL DEFAULT 0.0,
+                row_count INTEGER DEFAULT 0,
+                success INTEGER DEFAULT 1,
+                error_message TEXT DEFAULT ''
+            )
+        ''')
+
+    def _migrate_timestamps(self, cursor: sqlite3.Cursor):
+        """Rebuild a history table that still stores ISO text timestamps."""
+        cursor.execute(
+            "SELECT type FROM pragma_table_info('query_history') WHERE name = 'timestamp'"
+        )
+        if cursor.fetchone()[0].upper() != "TEXT":
+            return
+
+        # Unparseable legacy timestamps (empty or malformed) become 0 so a
+        # single bad row cannot abort the rebuild
+        invalid = 0
+
+        def iso_to_ns(timestamp) -> int:
+            nonlocal invalid
+            try:
+                return _timestamp_ns(timestamp)
+            except (TypeError, ValueError, OverflowError, OSError):
+                invalid += 1
+                return 0
+
+        # TEXT affinity would turn integers back into text, so the table is
+        # copied rather than updated in place
+        cursor.connection.create_function("iso_to_ns", 1, iso_to_ns)
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            self._create_table(cursor, "query_history_new")
+            cursor.execute('''
+                INSERT INTO query_history_new
+                SELECT id, database_path, query_text,
+                       iso_to_ns(timestamp),
+                       execution_time, row_count, success, error_message
+                FROM query_history
+            ''')
+            cursor.execute("DROP TABLE query_history")
+            cursor.execute("ALTER TABLE query_history_new RENAME TO query_history")
+            cursor.execute("COMMIT")
+        except sqlite3.Error:
+            cursor.execute("ROLLBACK")
+            raise
+
+        if invalid:
+            logger.warning(
+                f"Stored {invalid} unparseable query history timestamps as 0"
+            )
+        logger.info("Migrated query history timestamps to integer storage")
+
+    @staticmethod
+    def _create_fts(cursor: sqlite3.Cursor) -> bool:
         """
-        Add a query to history.
-
-        Args:
-            record: QueryRecord to add
+        Create the full-text search index if SQLite was built with FTS5.
 
         Returns:
-            ID of inserted record
+            True if the index is available
         """
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'query_history_fts'"
+        )
+        exists = cursor.fetchone() is not None
+
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            for statement in FTS_SCHEMA:
+                cursor.execute(statement)
+            if not exists:
+                # Index the rows recorded before the FTS table existed
+                cursor.execute(
+                    "INSERT INTO query_history_fts(query_history_fts) VALUES ('rebuild')"
+                )
+            return True
 
-            # Set timestamp if not provided
-            if not record.timestamp:
-                record.timestamp = datetime.now().isoformat()
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Full-text search unavailable, using LIKE: {e}")
+            return False
 
-            cursor.execute('''
-                INSERT INTO query_history (
-                    database_path, query_text, timestamp,
-                    execution_time, row_count, success, error_message
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (
+    def close(self):
+        """Flush buffered records and close all pooled connections."""
+        self.flush()
+
+        with self._write_lock:
+            if self._writer is not None:
+                self._writer_cursor.close()
+                self._writer_cursor = None
+                self._writer.close()
+                self._writer = None
+
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def add_query(self, record: QueryRecord, timestamp_ns: Optional[int] = None) -> None:
+        """
+        Add a query to history.
+
+        The record is buffered and written by the next flush(), which runs
+        automatically after FLUSH_INTERVAL seconds or FLUSH_BATCH_SIZE records.
+
+        Args:
+            record: QueryRecord to add
+            timestamp_ns: Time of the query in epoch nanoseconds; if None,
+                record.timestamp is used, or the current time if it is empty
+                or not a valid ISO timestamp
+        """
+        # Stored as epoch nanoseconds
+        timestamp = timestamp_ns
+        if timestamp is None and record.timestamp:
+            try:
+                timestamp = _timestamp_ns(record.timestamp)
+            except ValueError:
+                logger.warning(f"Invalid query timestamp {record.timestamp!r}, using the current time")
+        if timestamp is None:
+            timestamp = time.time_ns()
+
+        with self._pending_lock:
+            self._pending.append((
                 record.database_path,
                 record.query_text,
-                record.timestamp,
+                timestamp,
                 record.execution_time,
                 record.row_count,
                 int(record.success),
                 record.error_message,
             ))
+            flush_now = len(self._pending) >= self.FLUSH_BATCH_SIZE
+            if not flush_now and self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.FLUSH_INTERVAL, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+        if flush_now:
+            self.flush()
 
-            conn.commit()
-            record_id = cursor.lastrowid
-            conn.close()
+    def flush(self) -> int:
+        """
+        Write all buffered records in a single transaction.
+
+        Returns:
+            Number of records written
+        """
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+        if not pending:
+            return 0
 
-            logger.debug(f"Added query to history: {record_id}")
-            return record_id
+        try:
+            # The SQL text is constant, so the connection's statement cache
+            # serves the prepared INSERT; the writer cursor is reused as well
+            with self._write():
+                self._writer_cursor.executemany(self.INSERT_SQL, pending)
+
+            logger.debug(f"Flushed {len(pending)} queries to history")
+            return len(pending)
 
         except sqlite3.Error as e:
-            logger.error(f"Failed to add query to history: {e}")
-            return -1
+            logger.error(f"Failed to add queries to history: {e}")
+            return 0
 
     def get_history(
         self,
         limit: int = 100,
-        database_path: Optional[str] = None
+        database_path: Optional[str] = None,
+        offset: int = 0
     ) -> List[QueryRecord]:
         """
         Get query history.
@@ -145,90 +399,121 @@ class QueryHistoryDB:
         Args:
             limit: Maximum number of records to return
             database_path: Filter by database path (optional)
+            offset: Number of newest records to skip
 
         Returns:
             List of QueryRecord objects
         """
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+        self.flush()
 
-            if database_path:
-                cursor.execute('''
-                    SELECT * FROM query_history
-                    WHERE database_path = ?
-                    ORDER BY timestamp DESC
-                    LIMIT ?
-                ''', (database_path, limit))
-            else:
-                cursor.execute('''
-                    SELECT * FROM query_history
-                    ORDER BY timestamp DESC
-                    LIMIT ?
-                ''', (limit,))
-
-            records = []
-            for row in cursor.fetchall():
-                records.append(QueryRecord(
-                    id=row[0],
-                    database_path=row[1],
-                    query_text=row[2],
-                    timestamp=row[3],
-                    execution_time=row[4],
-                    row_count=row[5],
-                    success=bool(row[6]),
-                    error_message=row[7],
-                ))
-
-            conn.close()
-            return records
+        try:
+            with self._read() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = _record_factory
+
+                if database_path:
+                    cursor.execute('''
+                        SELECT * FROM query_history
+                        WHERE database_path = ?
+                        ORDER BY timestamp DESC
+                        LIMIT ? OFFSET ?
+                    ''', (database_path, limit, offset))
+                else:
+                    cursor.execute('''
+                        SELECT * FROM query_history
+                        ORDER BY timestamp DESC
+                        LIMIT ? OFFSET ?
+                    ''', (limit, offset))
+
+                return cursor.fetchall()
 
         except sqlite3.Error as e:
             logger.error(f"Failed to get query history: {e}")
             return []
 
-    def search_history(self, search_term: str, limit: int = 100) -> List[QueryRecord]:
+    def _search_source(self, search_term: str) -> Tuple[str, tuple]:
+        """
+        Build the FROM ... WHERE clause selecting records matching a search term.
+
+        Uses the FTS5 index with a prefix match on every word of the search
+        term, falling back to a LIKE scan when FTS5 is unavailable or the
+        term has no words.
+
+        Returns:
+            Tuple of (SQL clause with history rows aliased as h, parameters)
+        """
+        tokens = _SEARCH_TOKEN.findall(search_term)
+        if self._fts_enabled and tokens:
+            match = " ".join(f'"{token}"*' for token in tokens)
+            return (
+                "query_history_fts f JOIN query_history h ON h.id = f.rowid "
+                "WHERE query_history_fts MATCH ?",
+                (match,),
+            )
+        return "query_history h WHERE h.query_text LIKE ?", (f'%{search_term}%',)
+
+    def search_history(
+        self,
+        search_term: str,
+        limit: int = 100,
+        offset: int = 0
+    ) -> List[QueryRecord]:
         """
         Search query history.
 
         Args:
             search_term: Search term to look for in query text
             limit: Maximum number of records to return
+            offset: Number of newest matching records to skip
 
         Returns:
             List of matching QueryRecord objects
         """
+        self.flush()
+
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            with self._read() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = _record_factory
 
-            cursor.execute('''
-                SELECT * FROM query_history
-                WHERE query_text LIKE ?
-                ORDER BY timestamp DESC
-                LIMIT ?
-            ''', (f'%{search_term}%', limit))
-
-            records = []
-            for row in cursor.fetchall():
-                records.append(QueryRecord(
-                    id=row[0],
-                    database_path=row[1],
-                    query_text=row[2],
-                    timestamp=row[3],
-                    execution_time=row[4],
-                    row_count=row[5],
-                    success=bool(row[6]),
-                    error_message=row[7],
-                ))
-
-            conn.close()
-            return records
+                source, params = self._search_source(search_term)
+                cursor.execute(f'''
+                    SELECT h.* FROM {source}
+                    ORDER BY h.timestamp DESC
+                    LIMIT ? OFFSET ?
+                ''', params + (limit, offset))
+
+                return cursor.fetchall()
 
         except sqlite3.Error as e:
             logger.error(f"Failed to search query history: {e}")
             return []
 
+    def count_history(self, search_term: Optional[str] = None) -> int:
+        """
+        Count history records.
+
+        Args:
+            search_term: Only count records matching this search term (optional)
+
+        Returns:
+            Number of records
+        """
+        self.flush()
+
+        try:
+            with self._read() as conn:
+                if search_term:
+                    source, params = self._search_source(search_term)
+                    cursor = conn.execute(f"SELECT COUNT(*) FROM {source}", params)
+                else:
+                    cursor = conn.execute("SELECT COUNT(*) FROM query_history")
+                return cursor.fetchone()[0]
+
+        except sqlite3.Error as e:
+            logger.error(f"Failed to count query history: {e}")
+            return 0
+
     def delete_record(self, record_id: int) -> bool:
         """
         Delete a specific record.
@@ -239,15 +524,12 @@ class QueryHistoryDB:
         Returns:
             True if deleted successfully
         """
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute('DELETE FROM query_history WHERE id = ?', (record_id,))
+        self.flush()
 
-            conn.commit()
-            deleted = cursor.rowcount > 0
-            conn.close()
+        try:
+            with self._write() as conn:
+                cursor = conn.execute('DELETE FROM query_history WHERE id = ?', (record_id,))
+                deleted = cursor.rowcount > 0
 
             if deleted:
                 logger.debug(f"Deleted query history record: {record_id}")
@@ -265,14 +547,11 @@ class QueryHistoryDB:
         Returns:
             True if cleared successfully
         """
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+        self.flush()
 
-            cursor.execute('DELETE FROM query_history')
-
-            conn.commit()
-            conn.close()
+        try:
+            with self._write() as conn:
+                conn.execute('DELETE FROM query_history')
 
             logger.info("Cleared all query history")
             return True
@@ -288,23 +567,23 @@ class QueryHistoryDB:
         Returns:
             Dictionary with statistics
         """
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+        self.flush()
 
-            cursor.execute('SELECT COUNT(*) FROM query_history')
-            total = cursor.fetchone()[0]
+        try:
+            with self._read() as conn:
+                cursor = conn.cursor()
 
-            cursor.execute('SELECT COUNT(*) FROM query_history WHERE success = 1')
-            success = cursor.fetchone()[0]
+                cursor.execute('SELECT COUNT(*) FROM query_history')
+                total = cursor.fetchone()[0]
 
-            cursor.execute('SELECT AVG(execution_time) FROM query_history WHERE success = 1')
-            avg_time = cursor.fetchone()[0] or 0.0
+                cursor.execute('SELECT COUNT(*) FROM query_history WHERE success = 1')
+                success = cursor.fetchone()[0]
 
-            cursor.execute('SELECT COUNT(DISTINCT database_path) FROM query_history')
-            unique_dbs = cursor.fetchone()[0]
+                cursor.execute('SELECT AVG(execution_time) FROM query_history WHERE success = 1')
+                avg_time = cursor.fetchone()[0] or 0.0
 
-            conn.close()
+                cursor.execute('SELECT COUNT(DISTINCT database_path) FROM query_history')
+                unique_dbs = cursor.fetchone()[0]
 
             return {
                 'total': total,
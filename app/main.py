@@ -5,35 +5,80 @@ A PySide6 desktop application for viewing local database files.
 """
 
 import sys
+import atexit
 import logging
+import logging.handlers
+import queue
 from pathlib import Path
+from typing import Optional, Tuple
 
 from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 
 # Setup logging
 LOG_DIR = Path(__file__).parent.parent / "logs"
 LOG_DIR.mkdir(exist_ok=True)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(LOG_DIR / "app.log", encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
+STYLESHEET_PATH = Path(__file__).parent.parent / "resources" / "styles" / "dark_theme.qss"
+
+# (mtime, contents) of the last stylesheet read
+_STYLESHEET_CACHE: Optional[Tuple[float, str]] = None
+
+
+def setup_logging():
+    """
+    Route log records through a queue to the file and console handlers.
+
+    The handlers run on the listener thread, and the log file is only
+    opened when the first record is written, so logging never blocks the
+    UI thread on disk I/O.
+    """
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    file_handler = logging.FileHandler(LOG_DIR / "app.log", encoding='utf-8', delay=True)
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    # Records are formatted by the listener's handlers, not the queue handler
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+
+setup_logging()
 
 logger = logging.getLogger(__name__)
 
 
 def load_stylesheet() -> str:
-    """Load the dark theme stylesheet."""
-    style_path = Path(__file__).parent.parent / "resources" / "styles" / "dark_theme.qss"
-    if style_path.exists():
-        with open(style_path, 'r', encoding='utf-8') as f:
-            return f.read()
-    return ""
+    """Load the dark theme stylesheet, re-reading it only when the file changed."""
+    global _STYLESHEET_CACHE
+
+    try:
+        mtime = STYLESHEET_PATH.stat().st_mtime
+    except OSError:
+        return ""
+
+    if _STYLESHEET_CACHE is None or _STYLESHEET_CACHE[0] != mtime:
+        with open(STYLESHEET_PATH, 'r', encoding='utf-8') as f:
+            _STYLESHEET_CACHE = (mtime, f.read())
+    return _STYLESHEET_CACHE[1]
+
+
+def apply_stylesheet(app: QApplication):
+    """Apply the dark theme stylesheet to the application."""
+    stylesheet = load_stylesheet()
+    if stylesheet:
+        app.setStyleSheet(stylesheet)
+        logger.info("Dark theme loaded")
 
 
 def main():
@@ -53,12 +98,6 @@ def main():
     app.setApplicationVersion("1.0.0")
     app.setOrganizationName("Local DB Viewer")
 
-    # Load stylesheet
-    stylesheet = load_stylesheet()
-    if stylesheet:
-        app.setStyleSheet(stylesheet)
-        logger.info("Dark theme loaded")
-
     # Import and create main window
     from app.ui.main_window import MainWindow
 
@@ -67,6 +106,9 @@ def main():
 
     logger.info("Application window shown")
 
+    # Theme is applied once the event loop has painted the window
+    QTimer.singleShot(0, lambda: apply_stylesheet(app))
+
     # Start event loop
     exit_code = app.exec()
 
@@ -1,19 +1,27 @@
 """
 UI components package.
+
+Widgets are imported on first access (PEP 562), so importing one UI module
+does not load the others and their dependencies.
 """
 
-from .main_window import MainWindow
-from .database_tree import DatabaseTreeWidget
-from .schema_viewer import SchemaViewer
-from .data_viewer import DataViewer
-from .query_editor import QueryEditor
-from .history_viewer import HistoryViewer
+import importlib
+
+# Exported name -> module that defines it
+_MODULES = {
+    'MainWindow': '.main_window',
+    'DatabaseTreeWidget': '.database_tree',
+    'SchemaViewer': '.schema_viewer',
+    'DataViewer': '.data_viewer',
+    'QueryEditor': '.query_editor',
+    'HistoryViewer': '.history_viewer',
+}
+
+__all__ = list(_MODULES)
+
 
-__all__ = [
-    'MainWindow',
-    'DatabaseTreeWidget',
-    'SchemaViewer',
-    'DataViewer',
-    'QueryEditor',
-    'HistoryViewer',
-]
+def __getattr__(name):
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __name__), name)
@@ -3,15 +3,18 @@ Data viewer widget for displaying table data with pagination.
 """
 
 import logging
-from typing import Optional
+from typing import Dict, Optional
 
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView, QApplication,
     QLabel, QPushButton, QComboBox, QSpinBox, QHeaderView
 )
-from PySide6.QtCore import Qt, Slot
+from PySide6.QtCore import Qt, Slot, QThreadPool, QTimer
+from PySide6.QtGui import QAction
 
 from app.core.connectors import BaseConnector, QueryResult
+from app.core.query_worker import QueryWorker
+from app.ui.table_model import RowsModel
 
 logger = logging.getLogger(__name__)
 
@@ -25,10 +28,19 @@ class DataViewer(QWidget):
     - Column sorting
     - Page size selection
     - Navigation buttons
+
+    Row counts and pages are loaded on the global QThreadPool; results of
+    superseded requests are discarded.
     """
 
     PAGE_SIZES = [50, 100, 200, 500, 1000]
 
+    # Initial column width in pixels; columns are not sized to their contents
+    DEFAULT_COLUMN_WIDTH = 150
+
+    # Delay before a typed/spun page number is loaded
+    PAGE_INPUT_DELAY_MS = 150
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -37,8 +49,14 @@ class DataViewer(QWidget):
         self.current_page = 1
         self.page_size = 100
         self.total_rows = 0
+        self.total_pages = 1
         self.order_by: Optional[str] = None
         self.order_desc = False
+        # Incremented per page request; stale page results are ignored
+        self._request_id = 0
+        self._shown_rows = 0
+        # Page number -> last_key of the page before it, for keyset paging
+        self._page_anchors: Dict[int, tuple] = {}
 
         self._setup_ui()
 
@@ -54,12 +72,24 @@ class DataViewer(QWidget):
         layout.addWidget(self.header_label)
 
         # Data table
-        self.data_table = QTableWidget()
+        self._model = RowsModel(self)
+        self.data_table = QTableView()
+        self.data_table.setModel(self._model)
         self.data_table.setAlternatingRowColors(True)
-        self.data_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.data_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.data_table.horizontalHeader().sectionClicked.connect(self._on_header_clicked)
-        self.data_table.horizontalHeader().setSectionsClickable(True)
+        self.data_table.setEditTriggers(QTableView.NoEditTriggers)
+        self.data_table.setSelectionBehavior(QTableView.SelectRows)
+        self.data_table.setTextElideMode(Qt.ElideRight)
+        header = self.data_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setDefaultSectionSize(self.DEFAULT_COLUMN_WIDTH)
+        header.sectionClicked.connect(self._on_header_clicked)
+        header.setSectionsClickable(True)
+
+        # Measuring cell text is only done on explicit request
+        self.data_table.setContextMenuPolicy(Qt.ActionsContextMenu)
+        self.action_fit_columns = QAction("Fit Columns", self.data_table)
+        self.action_fit_columns.triggered.connect(self._on_fit_columns)
+        self.data_table.addAction(self.action_fit_columns)
         layout.addWidget(self.data_table)
 
         # Pagination controls
@@ -93,6 +123,12 @@ class DataViewer(QWidget):
         self.page_input.valueChanged.connect(self._on_page_changed)
         pagination_layout.addWidget(self.page_input)
 
+        # Only the last value of a burst of spins is loaded
+        self._page_timer = QTimer(self)
+        self._page_timer.setSingleShot(True)
+        self._page_timer.setInterval(self.PAGE_INPUT_DELAY_MS)
+        self._page_timer.timeout.connect(self._on_page_input_settled)
+
         # Next/Last buttons
         self.btn_next = QPushButton(">")
         self.btn_next.setProperty("secondary", "true")
@@ -136,10 +172,14 @@ class DataViewer(QWidget):
         self.current_page = 1
         self.order_by = None
         self.order_desc = False
-
-        # Get total rows
-        self.total_rows = connector.get_row_count(table_name)
+        self._page_anchors.clear()
+        self.total_rows = 0
+        self._recalc_total_pages()
         self._update_pagination_controls()
+
+        # Count and first page are loaded in parallel
+        worker = QueryWorker(lambda: (connector, table_name, connector.get_row_count(table_name)))
+        self._start_worker(worker, self._on_row_count_loaded)
         self._load_data()
 
     def clear(self):
@@ -148,12 +188,14 @@ class DataViewer(QWidget):
         self.table_name = None
         self.current_page = 1
         self.total_rows = 0
+        self._recalc_total_pages()
         self.order_by = None
         self.order_desc = False
+        self._page_anchors.clear()
+        self._request_id += 1
 
         self.header_label.setText("Select a table to view data")
-        self.data_table.setRowCount(0)
-        self.data_table.setColumnCount(0)
+        self._model.clear()
         self._update_pagination_controls()
 
     def set_query_result(self, result: QueryResult):
@@ -165,25 +207,13 @@ class DataViewer(QWidget):
         """
         self.table_name = None
         self.total_rows = result.row_count
+        self._recalc_total_pages()
         self.current_page = 1
+        self._page_anchors.clear()
+        self._request_id += 1
 
         self.header_label.setText(f"Query Results ({result.row_count:,} rows)")
-
-        # Setup columns
-        self.data_table.setColumnCount(len(result.columns))
-        self.data_table.setHorizontalHeaderLabels(result.columns)
-
-        # Populate data
-        self.data_table.setRowCount(len(result.rows))
-        for row_idx, row in enumerate(result.rows):
-            for col_idx, value in enumerate(row):
-                item = QTableWidgetItem(str(value) if value is not None else "NULL")
-                if value is None:
-                    item.setForeground(Qt.gray)
-                self.data_table.setItem(row_idx, col_idx, item)
-
-        # Resize columns
-        self.data_table.resizeColumnsToContents()
+        self._model.set_result(result)
 
         self._update_pagination_controls()
 
@@ -192,51 +222,106 @@ class DataViewer(QWidget):
         if not self.connector or not self.table_name:
             return
 
+        self._request_id += 1
+        request_id = self._request_id
+        connector = self.connector
+        table_name = self.table_name
         offset = (self.current_page - 1) * self.page_size
+        limit = self.page_size
+        order_by = self.order_by
+        order_desc = self.order_desc
+        # Seek past the previous page when its last key is known; jumps to
+        # pages not reached sequentially fall back to OFFSET
+        after = self._page_anchors.get(self.current_page)
+
+        worker = QueryWorker(lambda: (request_id, connector.get_table_data(
+            table_name,
+            offset=offset,
+            limit=limit,
+            order_by=order_by,
+            order_desc=order_desc,
+            after=after,
+            columnar=True
+        )))
+        self._start_worker(worker, self._on_data_loaded)
+
+    def _start_worker(self, worker: QueryWorker, on_result):
+        """Run a worker on the thread pool with a wait cursor while it runs."""
+        worker.signals.result.connect(on_result)
+        worker.signals.error.connect(self._on_load_error)
+        worker.signals.finished.connect(self._on_worker_finished)
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        QThreadPool.globalInstance().start(worker)
+
+    @Slot(object)
+    def _on_row_count_loaded(self, payload: tuple):
+        """Apply a row count loaded in the background."""
+        connector, table_name, row_count = payload
+        if connector is not self.connector or table_name != self.table_name:
+            return
 
-        try:
-            result = self.connector.get_table_data(
-                self.table_name,
-                offset=offset,
-                limit=self.page_size,
-                order_by=self.order_by,
-                order_desc=self.order_desc
-            )
+        page = self.current_page
+        self.total_rows = row_count
+        self._recalc_total_pages()
+        self._update_pagination_controls()
+        self._update_header()
 
-            if result.success:
-                self._display_result(result)
-            else:
-                logger.error(f"Failed to load data: {result.error}")
+        # The table shrank below the page being shown
+        if self.current_page != page:
+            self._load_data()
 
-        except Exception as e:
-            logger.error(f"Error loading data: {e}")
+    @Slot(object)
+    def _on_data_loaded(self, payload: tuple):
+        """Display a page loaded in the background."""
+        request_id, result = payload
+        if request_id != self._request_id:
+            return
+
+        if result.success:
+            if result.last_key is not None:
+                self._page_anchors[self.current_page + 1] = result.last_key
+            self._display_result(result)
+        else:
+            logger.error(f"Failed to load data: {result.error}")
+
+    @Slot(str)
+    def _on_load_error(self, message: str):
+        """Handle an exception raised by a background load."""
+        logger.error(f"Error loading data: {message}")
+
+    @Slot()
+    def _on_worker_finished(self):
+        """Restore the cursor when a background load completes."""
+        QApplication.restoreOverrideCursor()
 
     def _display_result(self, result: QueryResult):
         """Display query result in table."""
-        # Update header
+        self._shown_rows = result.row_count
+        self._update_header()
+
+        # Cells are rendered lazily by the model
+        self._model.set_result(result)
+        self.data_table.scrollToTop()
+
+    def _update_header(self):
+        """Update the table header label."""
         self.header_label.setText(
-            f"Table: {self.table_name} (showing {len(result.rows):,} of {self.total_rows:,} rows)"
+            f"Table: {self.table_name} (showing {self._shown_rows:,} of {self.total_rows:,} rows)"
         )
 
-        # Setup columns
-        self.data_table.setColumnCount(len(result.columns))
-        self.data_table.setHorizontalHeaderLabels(result.columns)
-
-        # Populate data
-        self.data_table.setRowCount(len(result.rows))
-        for row_idx, row in enumerate(result.rows):
-            for col_idx, value in enumerate(row):
-                item = QTableWidgetItem(str(value) if value is not None else "NULL")
-                if value is None:
-                    item.setForeground(Qt.gray)
-                self.data_table.setItem(row_idx, col_idx, item)
+    def _recalc_total_pages(self):
+        """
+        Recompute total_pages after total_rows or page_size changed.
 
-        # Resize columns to content
-        self.data_table.resizeColumnsToContents()
+        current_page is clamped to the new page range, since a count that
+        arrives from a background load may leave fewer pages than before.
+        """
+        self.total_pages = max(1, (self.total_rows + self.page_size - 1) // self.page_size)
+        self.current_page = min(self.current_page, self.total_pages)
 
     def _update_pagination_controls(self):
         """Update pagination control states."""
-        total_pages = max(1, (self.total_rows + self.page_size - 1) // self.page_size)
+        total_pages = self.total_pages
 
         self.page_label.setText(f"Page {self.current_page} of {total_pages}")
         self.page_input.setMaximum(total_pages)
@@ -268,8 +353,7 @@ class DataViewer(QWidget):
     @Slot()
     def _on_next_page(self):
         """Go to next page."""
-        total_pages = max(1, (self.total_rows + self.page_size - 1) // self.page_size)
-        if self.current_page < total_pages:
+        if self.current_page < self.total_pages:
             self.current_page += 1
             self._update_pagination_controls()
             self._load_data()
@@ -277,18 +361,22 @@ class DataViewer(QWidget):
     @Slot()
     def _on_last_page(self):
         """Go to last page."""
-        total_pages = max(1, (self.total_rows + self.page_size - 1) // self.page_size)
-        if self.current_page != total_pages:
-            self.current_page = total_pages
+        if self.current_page != self.total_pages:
+            self.current_page = self.total_pages
             self._update_pagination_controls()
             self._load_data()
 
     @Slot(int)
     def _on_page_changed(self, page: int):
         """Handle page number input change."""
+        self._page_timer.start()
+
+    @Slot()
+    def _on_page_input_settled(self):
+        """Load the page entered in the page number input."""
+        page = self.page_input.value()
         if page != self.current_page and page >= 1:
-            total_pages = max(1, (self.total_rows + self.page_size - 1) // self.page_size)
-            if page <= total_pages:
+            if page <= self.total_pages:
                 self.current_page = page
                 self._update_pagination_controls()
                 self._load_data()
@@ -299,17 +387,24 @@ class DataViewer(QWidget):
         new_size = self.page_size_combo.currentData()
         if new_size and new_size != self.page_size:
             self.page_size = new_size
+            self._recalc_total_pages()
+            self._page_anchors.clear()
             self.current_page = 1
             self._update_pagination_controls()
             self._load_data()
 
+    @Slot()
+    def _on_fit_columns(self):
+        """Resize columns to fit their contents."""
+        self.data_table.resizeColumnsToContents()
+
     @Slot(int)
     def _on_header_clicked(self, column: int):
         """Handle column header click for sorting."""
         if not self.table_name:
             return
 
-        column_name = self.data_table.horizontalHeaderItem(column).text()
+        column_name = self._model.column_name(column)
 
         if self.order_by == column_name:
             # Toggle sort direction
@@ -319,6 +414,7 @@ class DataViewer(QWidget):
             self.order_by = column_name
             self.order_desc = False
 
+        self._page_anchors.clear()
         self.current_page = 1
         self._update_pagination_controls()
         self._load_data()
@@ -10,7 +10,7 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QTreeWidget, QTreeWidgetItem,
     QPushButton, QLabel, QFileDialog
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, Slot
 
 from app.core.connectors import BaseConnector, ConnectorFactory
 
@@ -54,8 +54,10 @@ class DatabaseTreeWidget(QWidget):
         self.tree.setHeaderHidden(True)
         self.tree.setAlternatingRowColors(True)
         self.tree.setAnimated(True)
+        self.tree.setUniformRowHeights(True)
         self.tree.itemClicked.connect(self._on_item_clicked)
         self.tree.itemDoubleClicked.connect(self._on_item_double_clicked)
+        self.tree.itemExpanded.connect(self._on_item_expanded)
         layout.addWidget(self.tree)
 
         # Open button
@@ -85,68 +87,134 @@ class DatabaseTreeWidget(QWidget):
 
     def _populate_tree(self):
         """Populate the tree with database structure."""
-        self.tree.clear()
+        self.tree.setUpdatesEnabled(False)
+        try:
+            self.tree.clear()
 
-        if not self.connector or not self.connector.is_connected:
-            return
+            if not self.connector or not self.connector.is_connected:
+                return
+
+            tables = self._build_tree()
+        finally:
+            self.tree.setUpdatesEnabled(True)
+
+        logger.info(f"Populated tree with {len(tables)} tables")
+
+    def _build_tree(self) -> list:
+        """
+        Build the database node and add it to the tree.
+
+        Child items are collected in lists and attached with one addChildren
+        call per parent; the whole subtree is built before it is added to
+        the tree.
+
+        Returns:
+            List of table names
+        """
+        user_role = Qt.UserRole
 
         # Create root node for database
         db_name = Path(self.connector.file_path).name if self.connector.file_path else "Database"
         db_item = QTreeWidgetItem([db_name])
-        db_item.setData(0, Qt.UserRole, {"type": "database", "path": self.connector.file_path})
-        self.tree.addTopLevelItem(db_item)
+        db_item.setData(0, user_role, {"type": "database", "path": self.connector.file_path})
+
+        folders = []
 
         # Add tables folder
         tables = self.connector.get_tables()
+        tables_folder = None
         if tables:
             tables_folder = QTreeWidgetItem(["Tables"])
-            tables_folder.setData(0, Qt.UserRole, {"type": "folder", "name": "tables"})
-            db_item.addChild(tables_folder)
+            tables_folder.setData(0, user_role, {"type": "folder", "name": "tables"})
 
+            table_items = []
             for table_name in tables:
                 table_item = QTreeWidgetItem([table_name])
-                table_item.setData(0, Qt.UserRole, {"type": "table", "name": table_name})
-                tables_folder.addChild(table_item)
-
-                # Add column info if we can get schema
-                try:
-                    schema = self.connector.get_schema(table_name)
-                    for col in schema.columns:
-                        col_text = f"{col.name} ({col.data_type})"
-                        if col.is_primary_key:
-                            col_text += " PK"
-                        if not col.nullable:
-                            col_text += " NOT NULL"
-                        col_item = QTreeWidgetItem([col_text])
-                        col_item.setData(0, Qt.UserRole, {
-                            "type": "column",
-                            "table": table_name,
-                            "name": col.name
-                        })
-                        table_item.addChild(col_item)
-                except Exception as e:
-                    logger.warning(f"Failed to get schema for {table_name}: {e}")
+                table_item.setData(0, user_role, {
+                    "type": "table",
+                    "name": table_name,
+                    "loaded": False
+                })
 
-            tables_folder.setExpanded(True)
+                # Columns are loaded when the table is first expanded
+                placeholder = QTreeWidgetItem(["Loading..."])
+                placeholder.setData(0, user_role, {"type": "placeholder"})
+                table_item.addChild(placeholder)
+
+                table_items.append(table_item)
+
+            tables_folder.addChildren(table_items)
+            folders.append(tables_folder)
 
         # Add views folder if there are views
         if hasattr(self.connector, 'get_views'):
             views = self.connector.get_views()
             if views:
                 views_folder = QTreeWidgetItem(["Views"])
-                views_folder.setData(0, Qt.UserRole, {"type": "folder", "name": "views"})
-                db_item.addChild(views_folder)
+                views_folder.setData(0, user_role, {"type": "folder", "name": "views"})
 
+                view_items = []
                 for view_name in views:
                     view_item = QTreeWidgetItem([view_name])
-                    view_item.setData(0, Qt.UserRole, {"type": "view", "name": view_name})
-                    views_folder.addChild(view_item)
+                    view_item.setData(0, user_role, {"type": "view", "name": view_name})
+                    view_items.append(view_item)
 
-        # Expand database item
+                views_folder.addChildren(view_items)
+                folders.append(views_folder)
+
+        db_item.addChildren(folders)
+        self.tree.addTopLevelItem(db_item)
+
+        # Items can only be expanded once they are in the tree
         db_item.setExpanded(True)
+        if tables_folder is not None:
+            tables_folder.setExpanded(True)
 
-        logger.info(f"Populated tree with {len(tables)} tables")
+        return tables
+
+    def _load_columns(self, table_item: QTreeWidgetItem, table_name: str):
+        """Replace a table's placeholder child with its columns."""
+        table_item.takeChildren()
+
+        try:
+            columns = self.connector.get_columns(table_name)
+        except Exception as e:
+            logger.warning(f"Failed to get schema for {table_name}: {e}")
+            return
+
+        user_role = Qt.UserRole
+        col_items = []
+        for col in columns:
+            col_text = f"{col.name} ({col.data_type})"
+            if col.is_primary_key:
+                col_text += " PK"
+            if not col.nullable:
+                col_text += " NOT NULL"
+            col_item = QTreeWidgetItem([col_text])
+            col_item.setData(0, user_role, {
+                "type": "column",
+                "table": table_name,
+                "name": col.name
+            })
+            col_items.append(col_item)
+
+        table_item.addChildren(col_items)
+
+    @Slot(QTreeWidgetItem)
+    def _on_item_expanded(self, item: QTreeWidgetItem):
+        """Load table columns on first expand."""
+        data = item.data(0, Qt.UserRole)
+        if not data or data.get("type") != "table" or data.get("loaded"):
+            return
+
+        if not self.connector or not self.connector.is_connected:
+            return
+
+        data["loaded"] = True
+        item.setData(0, Qt.UserRole, data)
+        self._load_columns(item, data["name"])
 
+    @Slot(QTreeWidgetItem, int)
     def _on_item_clicked(self, item: QTreeWidgetItem, column: int):
         """Handle item click."""
         data = item.data(0, Qt.UserRole)
@@ -165,6 +233,7 @@ class DatabaseTreeWidget(QWidget):
             self.table_selected.emit(view_name)
             logger.debug(f"View selected: {view_name}")
 
+    @Slot(QTreeWidgetItem, int)
     def _on_item_double_clicked(self, item: QTreeWidgetItem, column: int):
         """Handle item double click."""
         data = item.data(0, Qt.UserRole)
@@ -178,6 +247,7 @@ class DatabaseTreeWidget(QWidget):
             name = data.get("name")
             self.table_selected.emit(name)
 
+    @Slot()
     def _on_open_clicked(self):
         """Handle open button click."""
         self.open_requested.emit()
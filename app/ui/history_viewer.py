@@ -3,15 +3,20 @@ Query history viewer widget.
 """
 
 import logging
+import time
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
-    QPushButton, QLineEdit, QLabel, QHeaderView, QMessageBox
+    QPushButton, QLineEdit, QLabel, QHeaderView, QMessageBox, QSpinBox,
+    QComboBox
 )
-from PySide6.QtCore import Qt, Signal, Slot
+from PySide6.QtCore import Qt, Signal, Slot, QTimer, QThreadPool
+from PySide6.QtGui import QBrush
 
+from app.core.query_worker import QueryWorker
 from app.db.query_history import QueryHistoryDB, QueryRecord
 
 logger = logging.getLogger(__name__)
@@ -24,22 +29,57 @@ class HistoryViewer(QWidget):
     Features:
     - View query history
     - Search queries
+    - Pagination
     - Double-click to load query into editor
     - Clear history
 
     Signals:
         query_selected(str): Emitted when a query is selected
+
+    The history database is opened, read and cleared on the global
+    QThreadPool so it is never queried on the UI thread. Until it has been
+    opened the viewer is disabled and shows a loading message.
     """
 
     query_selected = Signal(str)
 
+    PAGE_SIZES = [50, 100, 200]
+
+    # Delay after the last keystroke before the history is searched
+    SEARCH_DELAY_MS = 200
+
+    # Minimum seconds between statistics queries; added queries are counted
+    # into the shown statistics directly in between
+    STATS_INTERVAL = 5.0
+
+    ERROR_BRUSH = QBrush(Qt.red)
+    DEFAULT_BRUSH = QBrush()
+    NUMBER_ALIGNMENT = Qt.AlignRight | Qt.AlignVCenter
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        self.history_db = QueryHistoryDB()
+        # Opened in the background, see _open_history_db()
+        self.history_db: Optional[QueryHistoryDB] = None
+
+        # Queries recorded while the database is still being opened, with
+        # their time in epoch nanoseconds
+        self._queued_records: list = []
+
+        self.current_page = 1
+        self.page_size = 200
+        self.total_rows = 0
+        self.total_pages = 1
+
+        # Incremented per page request; stale page results are ignored
+        self._request_id = 0
+
+        # Last loaded statistics and when (time.monotonic()) they were read
+        self._stats: Optional[dict] = None
+        self._stats_loaded_at = 0.0
 
         self._setup_ui()
-        self._load_history()
+        self._open_history_db()
 
     def _setup_ui(self):
         """Setup the widget UI."""
@@ -63,6 +103,11 @@ class HistoryViewer(QWidget):
         self.search_input.textChanged.connect(self._on_search_changed)
         header_layout.addWidget(self.search_input)
 
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DELAY_MS)
+        self._search_timer.timeout.connect(self._load_history)
+
         # Refresh button
         self.btn_refresh = QPushButton("Refresh")
         self.btn_refresh.setProperty("secondary", "true")
@@ -98,23 +143,210 @@ class HistoryViewer(QWidget):
 
         layout.addWidget(self.history_table)
 
+        # Pagination controls
+        pagination_layout = QHBoxLayout()
+
+        self.btn_first = QPushButton("<<")
+        self.btn_first.setProperty("secondary", "true")
+        self.btn_first.setMaximumWidth(40)
+        self.btn_first.clicked.connect(self._on_first_page)
+        pagination_layout.addWidget(self.btn_first)
+
+        self.btn_prev = QPushButton("<")
+        self.btn_prev.setProperty("secondary", "true")
+        self.btn_prev.setMaximumWidth(40)
+        self.btn_prev.clicked.connect(self._on_prev_page)
+        pagination_layout.addWidget(self.btn_prev)
+
+        # Page info
+        self.page_label = QLabel("Page 1 of 1")
+        pagination_layout.addWidget(self.page_label)
+
+        # Page number input
+        self.page_input = QSpinBox()
+        self.page_input.setMinimum(1)
+        self.page_input.setMaximum(1)
+        self.page_input.setMaximumWidth(80)
+        self.page_input.setKeyboardTracking(False)
+        self.page_input.valueChanged.connect(self._on_page_changed)
+        pagination_layout.addWidget(self.page_input)
+
+        self.btn_next = QPushButton(">")
+        self.btn_next.setProperty("secondary", "true")
+        self.btn_next.setMaximumWidth(40)
+        self.btn_next.clicked.connect(self._on_next_page)
+        pagination_layout.addWidget(self.btn_next)
+
+        self.btn_last = QPushButton(">>")
+        self.btn_last.setProperty("secondary", "true")
+        self.btn_last.setMaximumWidth(40)
+        self.btn_last.clicked.connect(self._on_last_page)
+        pagination_layout.addWidget(self.btn_last)
+
+        pagination_layout.addStretch()
+
+        # Page size selector
+        pagination_layout.addWidget(QLabel("Rows per page:"))
+        self.page_size_combo = QComboBox()
+        for size in self.PAGE_SIZES:
+            self.page_size_combo.addItem(str(size), size)
+        self.page_size_combo.setCurrentIndex(self.PAGE_SIZES.index(self.page_size))
+        self.page_size_combo.currentIndexChanged.connect(self._on_page_size_changed)
+        pagination_layout.addWidget(self.page_size_combo)
+
+        layout.addLayout(pagination_layout)
+
         # Statistics label
         self.stats_label = QLabel("")
         layout.addWidget(self.stats_label)
 
+    def _open_history_db(self):
+        """Open the history database in the background, showing the viewer as loading."""
+        self.setEnabled(False)
+        self.stats_label.setText("Loading query history...")
+
+        worker = QueryWorker(QueryHistoryDB)
+        worker.signals.result.connect(self._on_history_db_opened)
+        worker.signals.error.connect(self._on_open_error)
+        QThreadPool.globalInstance().start(worker)
+
+    @Slot(object)
+    def _on_history_db_opened(self, history_db: QueryHistoryDB):
+        """Start using the opened database and load the first page."""
+        self.history_db = history_db
+        for record, timestamp_ns in self._queued_records:
+            history_db.add_query(record, timestamp_ns)
+        self._queued_records.clear()
+
+        self.stats_label.setText("")
+        self.setEnabled(True)
+        self._load_history()
+
+    @Slot(str)
+    def _on_open_error(self, message: str):
+        """Handle a failure to open the history database."""
+        self.stats_label.setText("Query history is unavailable")
+        logger.error(f"Failed to open query history: {message}")
+
+    @Slot()
     def _load_history(self):
-        """Load query history from database."""
-        search_term = self.search_input.text().strip()
+        """Reload the history from the first page (refresh, search or clear)."""
+        if self.history_db is None:
+            return
+
+        self.current_page = 1
+        self._load_page(with_count=True)
+
+    def _load_page(self, with_count: bool = False):
+        """
+        Load the records of the current page in the background.
+
+        Args:
+            with_count: Also recount the records, and reload the statistics
+                if they are older than STATS_INTERVAL
+        """
+        if self.history_db is None:
+            return
+
+        with_stats = (
+            with_count and time.monotonic() - self._stats_loaded_at > self.STATS_INTERVAL
+        )
+
+        self._request_id += 1
+        worker = QueryWorker(
+            self._fetch_page,
+            self.history_db,
+            self._request_id,
+            self.search_input.text().strip(),
+            (self.current_page - 1) * self.page_size,
+            self.page_size,
+            with_count,
+            with_stats,
+        )
+        self._start_worker(worker, self._on_page_loaded)
+
+    def _load_statistics(self):
+        """Reload the statistics label in the background."""
+        if self.history_db is None:
+            return
+
+        worker = QueryWorker(self.history_db.get_statistics)
+        self._start_worker(worker, self._on_statistics_loaded)
+
+    @staticmethod
+    def _fetch_page(history_db: QueryHistoryDB, request_id: int, search_term: str,
+                    offset: int, limit: int, with_count: bool, with_stats: bool) -> tuple:
+        """Read one history page (and optionally counts); runs on a pool thread."""
+        total = stats = None
+        if with_count:
+            total = history_db.count_history(search_term or None)
+        if with_stats:
+            stats = history_db.get_statistics()
 
         if search_term:
-            records = self.history_db.search_history(search_term)
+            records = history_db.search_history(search_term, limit=limit, offset=offset)
         else:
-            records = self.history_db.get_history(limit=200)
+            records = history_db.get_history(limit=limit, offset=offset)
+
+        return request_id, total, records, stats
+
+    def _start_worker(self, worker: QueryWorker, on_result):
+        """Run a worker on the thread pool."""
+        worker.signals.result.connect(on_result)
+        worker.signals.error.connect(self._on_load_error)
+        QThreadPool.globalInstance().start(worker)
+
+    @Slot(object)
+    def _on_page_loaded(self, payload: tuple):
+        """Display a history page loaded in the background."""
+        request_id, total, records, stats = payload
+        if request_id != self._request_id:
+            return
+
+        if total is not None:
+            self.total_rows = total
+            self._recalc_total_pages()
+        if stats is not None:
+            self._on_statistics_loaded(stats)
 
         self._display_records(records)
+        self._update_pagination_controls()
+
+    @Slot(str)
+    def _on_load_error(self, message: str):
+        """Handle an exception raised by a background load."""
+        logger.error(f"Error loading query history: {message}")
 
-        # Update statistics
-        stats = self.history_db.get_statistics()
+    @Slot(object)
+    def _on_statistics_loaded(self, stats: Optional[dict]):
+        """Store statistics read from the database and show them."""
+        if stats:
+            self._stats = stats
+            self._stats_loaded_at = time.monotonic()
+            self._show_statistics()
+
+    def _count_in_statistics(self, record: QueryRecord):
+        """Add a newly recorded query to the shown statistics."""
+        stats = self._stats
+        if stats is None:
+            self._load_statistics()
+            return
+
+        stats['total'] = stats.get('total', 0) + 1
+        if record.success:
+            success = stats.get('success', 0)
+            avg_time = stats.get('avg_execution_time', 0.0)
+            stats['avg_execution_time'] = (
+                (avg_time * success + record.execution_time) / (success + 1)
+            )
+            stats['success'] = success + 1
+        else:
+            stats['failed'] = stats.get('failed', 0) + 1
+        self._show_statistics()
+
+    def _show_statistics(self):
+        """Update the statistics label."""
+        stats = self._stats
         if stats:
             self.stats_label.setText(
                 f"Total: {stats.get('total', 0)} queries | "
@@ -125,43 +357,113 @@ class HistoryViewer(QWidget):
 
     def _display_records(self, records: list):
         """Display query records in table."""
-        self.history_table.setRowCount(len(records))
-
+        table = self.history_table
+
+        # No repaints or item signals while the table is filled
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            # Items of rows that stay are updated in place instead of recreated
+            table.setRowCount(len(records))
+            self._fill_rows(records)
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+
+    def _fill_rows(self, records: list):
+        """Create the table items for records, one row each."""
         for row_idx, record in enumerate(records):
-            # Timestamp
-            try:
-                dt = datetime.fromisoformat(record.timestamp)
-                timestamp_str = dt.strftime("%Y-%m-%d %H:%M:%S")
-            except:
-                timestamp_str = record.timestamp
-
-            timestamp_item = QTableWidgetItem(timestamp_str)
-            timestamp_item.setData(Qt.UserRole, record)
-            self.history_table.setItem(row_idx, 0, timestamp_item)
-
-            # Query (truncated)
-            query_text = record.query_text.replace('\n', ' ').strip()
-            if len(query_text) > 100:
-                query_text = query_text[:100] + "..."
-            self.history_table.setItem(row_idx, 1, QTableWidgetItem(query_text))
-
-            # Execution time
-            time_item = QTableWidgetItem(f"{record.execution_time:.3f}")
-            time_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            self.history_table.setItem(row_idx, 2, time_item)
-
-            # Row count
-            rows_item = QTableWidgetItem(f"{record.row_count:,}")
-            rows_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            self.history_table.setItem(row_idx, 3, rows_item)
-
-            # Status
-            status_text = "OK" if record.success else "Error"
-            status_item = QTableWidgetItem(status_text)
-            if not record.success:
-                status_item.setForeground(Qt.red)
-                status_item.setToolTip(record.error_message)
-            self.history_table.setItem(row_idx, 4, status_item)
+            self._set_row(row_idx, record)
+
+    def _item(self, row_idx: int, col_idx: int) -> QTableWidgetItem:
+        """Return the item of a cell, creating it only if the cell is empty."""
+        item = self.history_table.item(row_idx, col_idx)
+        if item is None:
+            item = QTableWidgetItem()
+            if col_idx in (2, 3):
+                item.setTextAlignment(self.NUMBER_ALIGNMENT)
+            self.history_table.setItem(row_idx, col_idx, item)
+        return item
+
+    def _set_row(self, row_idx: int, record: QueryRecord):
+        """Fill the table items of a single record."""
+        # Timestamp
+        try:
+            dt = datetime.fromisoformat(record.timestamp)
+            timestamp_str = dt.strftime("%Y-%m-%d %H:%M:%S")
+        except:
+            timestamp_str = record.timestamp
+
+        timestamp_item = self._item(row_idx, 0)
+        timestamp_item.setText(timestamp_str)
+        timestamp_item.setData(Qt.UserRole, record)
+
+        # Query (truncated)
+        query_text = record.query_text.replace('\n', ' ').strip()
+        if len(query_text) > 100:
+            query_text = query_text[:100] + "..."
+        self._item(row_idx, 1).setText(query_text)
+
+        # Execution time
+        self._item(row_idx, 2).setText(f"{record.execution_time:.3f}")
+
+        # Row count
+        self._item(row_idx, 3).setText(f"{record.row_count:,}")
+
+        # Status
+        status_item = self._item(row_idx, 4)
+        if record.success:
+            status_item.setText("OK")
+            status_item.setForeground(self.DEFAULT_BRUSH)
+            status_item.setToolTip("")
+        else:
+            status_item.setText("Error")
+            status_item.setForeground(self.ERROR_BRUSH)
+            status_item.setToolTip(record.error_message)
+
+    def _prepend_record(self, record: QueryRecord):
+        """Insert a new record at the top of the first page, trimming the last row."""
+        table = self.history_table
+
+        # Stored records are stamped by the database; only a shown one needs its text
+        record.timestamp = datetime.now().isoformat()
+
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            table.insertRow(0)
+            self._set_row(0, record)
+            if table.rowCount() > self.page_size:
+                table.removeRow(table.rowCount() - 1)
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+
+    def _recalc_total_pages(self):
+        """
+        Recompute total_pages after total_rows or page_size changed.
+
+        current_page is clamped to the new page range, since a count that
+        arrives from a background load may leave fewer pages than before.
+        """
+        self.total_pages = max(1, (self.total_rows + self.page_size - 1) // self.page_size)
+        self.current_page = min(self.current_page, self.total_pages)
+
+    def _update_pagination_controls(self):
+        """Update pagination control states."""
+        total_pages = self.total_pages
+
+        self.page_label.setText(f"Page {self.current_page} of {total_pages}")
+        self.page_input.blockSignals(True)
+        self.page_input.setMaximum(total_pages)
+        self.page_input.setValue(self.current_page)
+        self.page_input.blockSignals(False)
+
+        # Enable/disable navigation buttons
+        self.btn_first.setEnabled(self.current_page > 1)
+        self.btn_prev.setEnabled(self.current_page > 1)
+        self.btn_next.setEnabled(self.current_page < total_pages)
+        self.btn_last.setEnabled(self.current_page < total_pages)
 
     def add_query(self, query: str, database_path: str, execution_time: float,
                   row_count: int, success: bool, error_message: str = ""):
@@ -185,13 +487,77 @@ class HistoryViewer(QWidget):
             error_message=error_message,
         )
 
+        # The first load after the database has been opened shows it
+        if self.history_db is None:
+            self._queued_records.append((record, time.time_ns()))
+            return
+
         self.history_db.add_query(record)
-        self._load_history()
+        self._count_in_statistics(record)
+
+        # A search result set may not include the new query; leave it as is
+        if self.search_input.text().strip():
+            return
+
+        self.total_rows += 1
+        self._recalc_total_pages()
+
+        # Only the first page shows the newest queries
+        if self.current_page == 1:
+            self._prepend_record(record)
+
+        self._update_pagination_controls()
+
+    @Slot()
+    def _on_first_page(self):
+        """Go to first page."""
+        if self.current_page != 1:
+            self.current_page = 1
+            self._load_page()
+
+    @Slot()
+    def _on_prev_page(self):
+        """Go to previous page."""
+        if self.current_page > 1:
+            self.current_page -= 1
+            self._load_page()
+
+    @Slot()
+    def _on_next_page(self):
+        """Go to next page."""
+        if self.current_page < self.total_pages:
+            self.current_page += 1
+            self._load_page()
+
+    @Slot()
+    def _on_last_page(self):
+        """Go to last page."""
+        if self.current_page != self.total_pages:
+            self.current_page = self.total_pages
+            self._load_page()
+
+    @Slot(int)
+    def _on_page_changed(self, page: int):
+        """Handle page number input change."""
+        if page != self.current_page and 1 <= page <= self.total_pages:
+            self.current_page = page
+            self._load_page()
+
+    @Slot(int)
+    def _on_page_size_changed(self, index: int):
+        """Handle page size change."""
+        new_size = self.page_size_combo.currentData()
+        if new_size and new_size != self.page_size:
+            self.page_size = new_size
+            self._recalc_total_pages()
+            self.current_page = 1
+            self._load_page()
 
     @Slot()
     def _on_search_changed(self):
         """Handle search input change."""
-        self._load_history()
+        # Restarting the timer coalesces a burst of keystrokes into one search
+        self._search_timer.start()
 
     @Slot()
     def _on_double_clicked(self):
@@ -217,12 +583,26 @@ class HistoryViewer(QWidget):
         )
 
         if reply == QMessageBox.Yes:
-            if self.history_db.clear_history():
-                self._load_history()
-                logger.info("Query history cleared")
-            else:
-                QMessageBox.warning(
-                    self,
-                    "Error",
-                    "Failed to clear query history"
-                )
+            self.btn_clear.setEnabled(False)
+            worker = QueryWorker(self.history_db.clear_history)
+            worker.signals.finished.connect(self._on_clear_done)
+            self._start_worker(worker, self._on_history_cleared)
+
+    @Slot(object)
+    def _on_history_cleared(self, cleared: bool):
+        """Reload the emptied history, or report a failed clear."""
+        if cleared:
+            self._stats_loaded_at = 0.0
+            self._load_history()
+            logger.info("Query history cleared")
+        else:
+            QMessageBox.warning(
+                self,
+                "Error",
+                "Failed to clear query history"
+            )
+
+    @Slot()
+    def _on_clear_done(self):
+        """Re-enable the Clear All button once a clear has ended."""
+        self.btn_clear.setEnabled(True)
@@ -4,31 +4,92 @@ Main window for Local DB Viewer.
 
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Optional
 
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QSplitter, QTabWidget, QToolBar, QStatusBar,
     QFileDialog, QMessageBox, QLabel
 )
-from PySide6.QtCore import Qt, Slot
+from PySide6.QtCore import Qt, Slot, QTimer, QThreadPool
 from PySide6.QtGui import QAction, QKeySequence
 
 from app.core.connectors import (
     BaseConnector, ConnectorFactory, TableSchema,
     ConnectionError, UnsupportedDatabaseError
 )
+from app.core.query_worker import QueryWorker
 from app.ui.database_tree import DatabaseTreeWidget
 from app.ui.schema_viewer import SchemaViewer
-from app.ui.data_viewer import DataViewer
-from app.ui.query_editor import QueryEditor
-from app.ui.history_viewer import HistoryViewer
+
+# The lazily created tabs import their modules on creation, see LAZY_TABS
+if TYPE_CHECKING:
+    from app.ui.data_viewer import DataViewer
+    from app.ui.query_editor import QueryEditor
+    from app.ui.history_viewer import HistoryViewer
 
 logger = logging.getLogger(__name__)
 
 
 class MainWindow(QMainWindow):
-    """Main application window."""
+    """
+    Main application window.
+
+    Only the central splitter and the Schema tab are created with the
+    window. Menus, toolbar, status bar and signal connections follow one per
+    event loop pass, see _drain_bootstrap(). The Data, Query and History tabs
+    start as placeholders and are built on first access (or one per event
+    loop pass after bootstrap), see _ensure_tab().
+    """
+
+    SCHEMA_TAB, DATA_TAB, QUERY_TAB, HISTORY_TAB = range(4)
+
+    # Delay before building the Open Database dialog in the background
+    OPEN_DIALOG_PREWARM_MS = 500
+
+    # Attribute -> (text, shortcut, tooltip, slot name, initially enabled)
+    ACTIONS = {
+        # Menu actions
+        "action_open": ("Open Database...", QKeySequence.Open, None, "_on_open_database", True),
+        "action_close": ("Close Database", "Ctrl+W", None, "_on_close_database", False),
+        "action_exit": ("Exit", QKeySequence.Quit, None, "close", True),
+        "action_copy": ("Copy", QKeySequence.Copy, None, None, True),
+        "action_execute": ("Execute Query", "F5", None, "_on_execute_query", False),
+        "action_cancel": ("Cancel Query", "Ctrl+Break", None, "_on_cancel_query", False),
+        "action_clear": ("Clear Editor", None, None, "_on_clear_editor", True),
+        "action_refresh": ("Refresh", QKeySequence.Refresh, None, "_on_refresh", False),
+        "action_about": ("About", None, None, "_on_about", True),
+
+        # Toolbar buttons
+        "btn_open": ("Open", None, "Open Database (Ctrl+O)", "_on_open_database", True),
+        "btn_refresh": ("Refresh", None, "Refresh (F5)", "_on_refresh", False),
+        "btn_execute": ("Execute", None, "Execute Query (F5)", "_on_execute_query", False),
+        "btn_cancel": ("Cancel", None, "Cancel Query", "_on_cancel_query", False),
+        "btn_export": ("Export", None, "Export Results", "_on_export", False),
+    }
+
+    # (menu title, action attributes); None is a separator
+    MENUS = [
+        ("File", ["action_open", "action_close", None, "action_exit"]),
+        ("Edit", ["action_copy"]),
+        ("Query", ["action_execute", "action_cancel", None, "action_clear"]),
+        ("View", ["action_refresh"]),
+        ("Help", ["action_about"]),
+    ]
+
+    # Toolbar action attributes; None is a separator
+    TOOLBAR = [
+        "btn_open", "btn_refresh", None,
+        "btn_execute", "btn_cancel", None,
+        "btn_export",
+    ]
+
+    # Tab index -> (attribute, title, factory method name)
+    LAZY_TABS = {
+        DATA_TAB: ("_data_viewer", "Data", "_create_data_viewer"),
+        QUERY_TAB: ("_query_editor", "Query", "_create_query_editor"),
+        HISTORY_TAB: ("_history_viewer", "History", "_create_history_viewer"),
+    }
 
     def __init__(self):
         super().__init__()
@@ -36,14 +97,50 @@ class MainWindow(QMainWindow):
         self.connector: Optional[BaseConnector] = None
         self.current_table: Optional[str] = None
 
+        self._data_viewer: Optional["DataViewer"] = None
+        self._query_editor: Optional["QueryEditor"] = None
+        self._history_viewer: Optional["HistoryViewer"] = None
+
+        # Status label texts waiting for the next _flush_status()
+        self._pending_status: Dict[str, str] = {}
+        self.status_bar: Optional[QStatusBar] = None
+
+        # Incremented per table selection; stale schema results are ignored
+        self._nav_seq = 0
+
+        # Reused Open Database dialog, see _get_open_dialog()
+        self._open_dialog: Optional[QFileDialog] = None
+
         self._setup_ui()
-        self._create_menu_bar()
-        self._create_toolbar()
-        self._create_status_bar()
-        self._connect_signals()
+
+        # The rest is built after the window has had a chance to paint
+        self._bootstrap_queue = [
+            self._create_menu_bar,
+            self._create_toolbar,
+            self._create_status_bar,
+            self._connect_signals,
+            self._build_next_tab,
+        ]
+        QTimer.singleShot(0, self._drain_bootstrap)
+        QTimer.singleShot(self.OPEN_DIALOG_PREWARM_MS, self._get_open_dialog)
 
         logger.info("MainWindow initialized")
 
+    @property
+    def data_viewer(self) -> "DataViewer":
+        """Data tab, created on first access."""
+        return self._ensure_tab(self.DATA_TAB)
+
+    @property
+    def query_editor(self) -> "QueryEditor":
+        """Query tab, created on first access."""
+        return self._ensure_tab(self.QUERY_TAB)
+
+    @property
+    def history_viewer(self) -> "HistoryViewer":
+        """History tab, created on first access."""
+        return self._ensure_tab(self.HISTORY_TAB)
+
     def _setup_ui(self):
         """Setup the main UI layout."""
         self.setWindowTitle("Local DB Viewer")
@@ -70,16 +167,12 @@ class MainWindow(QMainWindow):
         # Right panel - Tab widget
         self.tab_widget = QTabWidget()
 
-        # Create tabs
+        # Create tabs; all but Schema are placeholders until first used
         self.schema_viewer = SchemaViewer()
-        self.data_viewer = DataViewer()
-        self.query_editor = QueryEditor()
-        self.history_viewer = HistoryViewer()
-
         self.tab_widget.addTab(self.schema_viewer, "Schema")
-        self.tab_widget.addTab(self.data_viewer, "Data")
-        self.tab_widget.addTab(self.query_editor, "Query")
-        self.tab_widget.addTab(self.history_viewer, "History")
+        for index in sorted(self.LAZY_TABS):
+            self.tab_widget.addTab(QWidget(), self.LAZY_TABS[index][1])
+        self.tab_widget.currentChanged.connect(self._on_tab_changed, Qt.UniqueConnection)
 
         # Add to splitter
         self.splitter.addWidget(self.database_tree)
@@ -89,73 +182,39 @@ class MainWindow(QMainWindow):
 
         main_layout.addWidget(self.splitter)
 
-    def _create_menu_bar(self):
-        """Create the menu bar."""
-        menubar = self.menuBar()
-
-        # File menu
-        file_menu = menubar.addMenu("File")
-
-        self.action_open = QAction("Open Database...", self)
-        self.action_open.setShortcut(QKeySequence.Open)
-        self.action_open.triggered.connect(self._on_open_database)
-        file_menu.addAction(self.action_open)
-
-        self.action_close = QAction("Close Database", self)
-        self.action_close.setShortcut(QKeySequence("Ctrl+W"))
-        self.action_close.triggered.connect(self._on_close_database)
-        self.action_close.setEnabled(False)
-        file_menu.addAction(self.action_close)
-
-        file_menu.addSeparator()
-
-        self.action_exit = QAction("Exit", self)
-        self.action_exit.setShortcut(QKeySequence.Quit)
-        self.action_exit.triggered.connect(self.close)
-        file_menu.addAction(self.action_exit)
-
-        # Edit menu
-        edit_menu = menubar.addMenu("Edit")
-
-        self.action_copy = QAction("Copy", self)
-        self.action_copy.setShortcut(QKeySequence.Copy)
-        edit_menu.addAction(self.action_copy)
-
-        # Query menu
-        query_menu = menubar.addMenu("Query")
-
-        self.action_execute = QAction("Execute Query", self)
-        self.action_execute.setShortcut(QKeySequence("F5"))
-        self.action_execute.triggered.connect(self._on_execute_query)
-        self.action_execute.setEnabled(False)
-        query_menu.addAction(self.action_execute)
-
-        self.action_cancel = QAction("Cancel Query", self)
-        self.action_cancel.setShortcut(QKeySequence("Ctrl+Break"))
-        self.action_cancel.setEnabled(False)
-        query_menu.addAction(self.action_cancel)
-
-        query_menu.addSeparator()
-
-        self.action_clear = QAction("Clear Editor", self)
-        self.action_clear.triggered.connect(self._on_clear_editor)
-        query_menu.addAction(self.action_clear)
-
-        # View menu
-        view_menu = menubar.addMenu("View")
-
-        self.action_refresh = QAction("Refresh", self)
-        self.action_refresh.setShortcut(QKeySequence.Refresh)
-        self.action_refresh.triggered.connect(self._on_refresh)
-        self.action_refresh.setEnabled(False)
-        view_menu.addAction(self.action_refresh)
+    @Slot()
+    def _drain_bootstrap(self):
+        """Run one pending bootstrap step, then yield to the event loop for the next."""
+        step = self._bootstrap_queue.pop(0)
+        step()
+        if self._bootstrap_queue:
+            QTimer.singleShot(0, self._drain_bootstrap)
+
+    def _build_actions(self):
+        """Create the menu and toolbar actions listed in ACTIONS."""
+        for attribute, (text, shortcut, tooltip, slot, enabled) in self.ACTIONS.items():
+            action = QAction(text, self)
+            if shortcut is not None:
+                action.setShortcut(QKeySequence(shortcut))
+            if tooltip is not None:
+                action.setToolTip(tooltip)
+            if slot is not None:
+                action.triggered.connect(getattr(self, slot))
+            action.setEnabled(enabled)
+            setattr(self, attribute, action)
 
-        # Help menu
-        help_menu = menubar.addMenu("Help")
+    def _create_menu_bar(self):
+        """Create the actions and the menu bar."""
+        self._build_actions()
 
-        self.action_about = QAction("About", self)
-        self.action_about.triggered.connect(self._on_about)
-        help_menu.addAction(self.action_about)
+        menubar = self.menuBar()
+        for title, attributes in self.MENUS:
+            menu = menubar.addMenu(title)
+            for attribute in attributes:
+                if attribute is None:
+                    menu.addSeparator()
+                else:
+                    menu.addAction(getattr(self, attribute))
 
     def _create_toolbar(self):
         """Create the toolbar."""
@@ -163,42 +222,11 @@ class MainWindow(QMainWindow):
         toolbar.setMovable(False)
         self.addToolBar(toolbar)
 
-        # Open button
-        self.btn_open = QAction("Open", self)
-        self.btn_open.setToolTip("Open Database (Ctrl+O)")
-        self.btn_open.triggered.connect(self._on_open_database)
-        toolbar.addAction(self.btn_open)
-
-        # Refresh button
-        self.btn_refresh = QAction("Refresh", self)
-        self.btn_refresh.setToolTip("Refresh (F5)")
-        self.btn_refresh.triggered.connect(self._on_refresh)
-        self.btn_refresh.setEnabled(False)
-        toolbar.addAction(self.btn_refresh)
-
-        toolbar.addSeparator()
-
-        # Execute button
-        self.btn_execute = QAction("Execute", self)
-        self.btn_execute.setToolTip("Execute Query (F5)")
-        self.btn_execute.triggered.connect(self._on_execute_query)
-        self.btn_execute.setEnabled(False)
-        toolbar.addAction(self.btn_execute)
-
-        # Cancel button
-        self.btn_cancel = QAction("Cancel", self)
-        self.btn_cancel.setToolTip("Cancel Query")
-        self.btn_cancel.setEnabled(False)
-        toolbar.addAction(self.btn_cancel)
-
-        toolbar.addSeparator()
-
-        # Export button
-        self.btn_export = QAction("Export", self)
-        self.btn_export.setToolTip("Export Results")
-        self.btn_export.triggered.connect(self._on_export)
-        self.btn_export.setEnabled(False)
-        toolbar.addAction(self.btn_export)
+        for attribute in self.TOOLBAR:
+            if attribute is None:
+                toolbar.addSeparator()
+            else:
+                toolbar.addAction(getattr(self, attribute))
 
     def _create_status_bar(self):
         """Create the status bar."""
@@ -221,39 +249,150 @@ class MainWindow(QMainWindow):
         self.status_query_time = QLabel("")
         self.status_bar.addPermanentWidget(self.status_query_time)
 
+        if self._pending_status:
+            self._flush_status()
+
+    def _set_status(self, key: str, text: str):
+        """
+        Queue a status bar label update.
+
+        Updates made while handling one event are applied together on the
+        next event loop pass, so the status bar is laid out once.
+
+        Args:
+            key: Label name: 'connection', 'tables', 'rows' or 'query_time'
+            text: New label text
+        """
+        if not self._pending_status:
+            QTimer.singleShot(0, self._flush_status)
+        self._pending_status[key] = text
+
+    @Slot()
+    def _flush_status(self):
+        """Apply queued status bar label updates."""
+        if self.status_bar is None:
+            # Applied by _create_status_bar()
+            return
+
+        pending = self._pending_status
+        self._pending_status = {}
+        for key, text in pending.items():
+            label = getattr(self, f"status_{key}")
+            if label.text() != text:
+                label.setText(text)
+
     def _connect_signals(self):
-        """Connect widget signals."""
+        """
+        Connect widget signals.
+
+        Connections use Qt.UniqueConnection, so running this again does not
+        make the slots fire twice.
+        """
         # Database tree signals
-        self.database_tree.database_opened.connect(self._on_database_opened)
-        self.database_tree.table_selected.connect(self._on_table_selected)
-        self.database_tree.open_requested.connect(self._on_open_database)
+        self.database_tree.database_opened.connect(self._on_database_opened, Qt.UniqueConnection)
+        self.database_tree.table_selected.connect(self._on_table_selected, Qt.UniqueConnection)
+        self.database_tree.open_requested.connect(self._on_open_database, Qt.UniqueConnection)
+
+    def _ensure_tab(self, index: int) -> QWidget:
+        """
+        Get the widget of a lazily created tab, building it if needed.
+
+        The placeholder is swapped for the real widget without changing the
+        current tab.
+        """
+        attribute, title, factory = self.LAZY_TABS[index]
+        widget = getattr(self, attribute)
+        if widget is not None:
+            return widget
+
+        widget = getattr(self, factory)()
+        setattr(self, attribute, widget)
+
+        tabs = self.tab_widget
+        current = tabs.currentIndex()
+        placeholder = tabs.widget(index)
+        tabs.blockSignals(True)
+        try:
+            tabs.removeTab(index)
+            tabs.insertTab(index, widget, title)
+            tabs.setCurrentIndex(current)
+        finally:
+            tabs.blockSignals(False)
+        placeholder.deleteLater()
+
+        return widget
 
-        # Query editor signals
-        self.query_editor.query_executed.connect(self._on_query_result)
-        self.query_editor.execute_requested.connect(self._on_execute_query)
+    def _create_data_viewer(self) -> "DataViewer":
+        """Create the Data tab."""
+        from app.ui.data_viewer import DataViewer
+
+        return DataViewer()
+
+    def _create_query_editor(self) -> "QueryEditor":
+        """Create the Query tab and connect its signals."""
+        from app.ui.query_editor import QueryEditor
+
+        editor = QueryEditor()
+        editor.query_executed.connect(self._on_query_result, Qt.UniqueConnection)
+        editor.execute_requested.connect(self._on_execute_query, Qt.UniqueConnection)
+        editor.query_running.connect(self._on_query_running, Qt.UniqueConnection)
+        if self.connector:
+            editor.set_connector(self.connector)
+        return editor
 
-        # History viewer signals
-        self.history_viewer.query_selected.connect(self._on_history_query_selected)
+    def _create_history_viewer(self) -> "HistoryViewer":
+        """Create the History tab and connect its signals."""
+        from app.ui.history_viewer import HistoryViewer
+
+        viewer = HistoryViewer()
+        viewer.query_selected.connect(self._on_history_query_selected, Qt.UniqueConnection)
+        return viewer
+
+    @Slot()
+    def _build_next_tab(self):
+        """Build one pending tab, then yield to the event loop for the next."""
+        for index, (attribute, _, _) in sorted(self.LAZY_TABS.items()):
+            if getattr(self, attribute) is None:
+                self._ensure_tab(index)
+                QTimer.singleShot(0, self._build_next_tab)
+                return
+
+    @Slot(int)
+    def _on_tab_changed(self, index: int):
+        """Build a placeholder tab when it is first shown."""
+        if index in self.LAZY_TABS:
+            self._ensure_tab(index)
 
     @Slot()
     def _on_open_database(self):
-        """Open a database file."""
-        file_filter = ConnectorFactory.get_all_filters()
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
-            "Open Database",
-            "",
-            file_filter
-        )
+        """Show the Open Database dialog; the chosen file is opened when it is accepted."""
+        self._get_open_dialog().open()
 
-        if file_path:
-            self._open_database(file_path)
+    @Slot()
+    def _get_open_dialog(self) -> QFileDialog:
+        """
+        Get the Open Database dialog, creating it on first use.
+
+        The dialog is Qt's own (not the platform's native one) so it can be
+        kept and reused instead of being rebuilt on every open.
+        """
+        if self._open_dialog is None:
+            dialog = QFileDialog(self, "Open Database")
+            dialog.setOption(QFileDialog.DontUseNativeDialog, True)
+            dialog.setFileMode(QFileDialog.ExistingFile)
+            dialog.setNameFilter(ConnectorFactory.get_all_filters())
+            dialog.fileSelected.connect(self._open_database)
+            self._open_dialog = dialog
+        return self._open_dialog
 
+    @Slot(str)
     def _open_database(self, file_path: str):
         """Open the specified database file."""
         try:
             # Close existing connection
             if self.connector:
+                if self._query_editor is not None:
+                    self._query_editor.cancel_query()
                 self.connector.disconnect()
 
             # Create connector and connect
@@ -262,7 +401,8 @@ class MainWindow(QMainWindow):
 
             # Update UI
             self.database_tree.set_database(self.connector)
-            self.query_editor.set_connector(self.connector)
+            if self._query_editor is not None:
+                self._query_editor.set_connector(self.connector)
 
             # Enable actions
             self.action_close.setEnabled(True)
@@ -274,8 +414,8 @@ class MainWindow(QMainWindow):
             # Update status bar
             db_name = Path(file_path).name
             tables = self.connector.get_tables()
-            self.status_connection.setText(f"Connected: {db_name}")
-            self.status_tables.setText(f"Tables: {len(tables)}")
+            self._set_status('connection', f"Connected: {db_name}")
+            self._set_status('tables', f"Tables: {len(tables)}")
 
             logger.info(f"Opened database: {file_path}")
 
@@ -287,14 +427,19 @@ class MainWindow(QMainWindow):
     def _on_close_database(self):
         """Close the current database connection."""
         if self.connector:
+            if self._query_editor is not None:
+                self._query_editor.cancel_query()
             self.connector.disconnect()
             self.connector = None
+        self._nav_seq += 1
 
         # Clear UI
         self.database_tree.clear_database()
         self.schema_viewer.clear()
-        self.data_viewer.clear()
-        self.query_editor.clear()
+        if self._data_viewer is not None:
+            self._data_viewer.clear()
+        if self._query_editor is not None:
+            self._query_editor.clear()
 
         # Disable actions
         self.action_close.setEnabled(False)
@@ -305,10 +450,10 @@ class MainWindow(QMainWindow):
         self.btn_export.setEnabled(False)
 
         # Update status bar
-        self.status_connection.setText("Not connected")
-        self.status_tables.setText("")
-        self.status_rows.setText("")
-        self.status_query_time.setText("")
+        self._set_status('connection', "Not connected")
+        self._set_status('tables', "")
+        self._set_status('rows', "")
+        self._set_status('query_time', "")
 
         self.current_table = None
         logger.info("Database closed")
@@ -326,15 +471,16 @@ class MainWindow(QMainWindow):
 
         self.current_table = table_name
 
-        # Load schema
-        try:
-            schema = self.connector.get_schema(table_name)
-            self.schema_viewer.set_schema(schema)
-            self.status_rows.setText(f"Rows: {schema.row_count:,}")
-        except Exception as e:
-            logger.error(f"Failed to load schema: {e}")
+        # Load schema in the background
+        self._nav_seq += 1
+        nav_seq = self._nav_seq
+        connector = self.connector
+        worker = QueryWorker(lambda: (nav_seq, connector.get_schema(table_name)))
+        worker.signals.result.connect(self._on_schema_loaded)
+        worker.signals.error.connect(self._on_schema_error)
+        QThreadPool.globalInstance().start(worker)
 
-        # Load data
+        # Load data (the data viewer loads its pages in the background)
         try:
             self.data_viewer.set_table(self.connector, table_name)
         except Exception as e:
@@ -343,6 +489,21 @@ class MainWindow(QMainWindow):
         # Switch to schema tab
         self.tab_widget.setCurrentWidget(self.schema_viewer)
 
+    @Slot(object)
+    def _on_schema_loaded(self, payload: tuple):
+        """Show a table schema loaded in the background."""
+        nav_seq, schema = payload
+        if nav_seq != self._nav_seq:
+            return
+
+        self.schema_viewer.set_schema(schema)
+        self._set_status('rows', f"Rows: {schema.row_count:,}")
+
+    @Slot(str)
+    def _on_schema_error(self, message: str):
+        """Handle a failed background schema load."""
+        logger.error(f"Failed to load schema: {message}")
+
     @Slot()
     def _on_execute_query(self):
         """Execute the current query."""
@@ -353,17 +514,31 @@ class MainWindow(QMainWindow):
         self.tab_widget.setCurrentWidget(self.query_editor)
         self.query_editor.execute_query()
 
+    @Slot()
+    def _on_cancel_query(self):
+        """Cancel the running query."""
+        self.query_editor.cancel_query()
+
+    @Slot(bool)
+    def _on_query_running(self, running: bool):
+        """Toggle execute/cancel actions while a query runs."""
+        can_execute = not running and self.connector is not None
+        self.action_execute.setEnabled(can_execute)
+        self.btn_execute.setEnabled(can_execute)
+        self.action_cancel.setEnabled(running)
+        self.btn_cancel.setEnabled(running)
+
     @Slot(dict)
     def _on_query_result(self, result: dict):
         """Handle query execution result."""
         if result.get('success'):
             execution_time = result.get('execution_time', 0)
             row_count = result.get('row_count', 0)
-            self.status_query_time.setText(f"Time: {execution_time:.3f}s")
-            self.status_rows.setText(f"Rows: {row_count:,}")
+            self._set_status('query_time', f"Time: {execution_time:.3f}s")
+            self._set_status('rows', f"Rows: {row_count:,}")
             self.btn_export.setEnabled(row_count > 0)
         else:
-            self.status_query_time.setText("")
+            self._set_status('query_time', "")
             self.btn_export.setEnabled(False)
 
     @Slot()
@@ -377,6 +552,9 @@ class MainWindow(QMainWindow):
         if not self.connector:
             return
 
+        # Re-read metadata that may have been changed by DDL
+        self.connector.invalidate_schema()
+
         # Refresh tree
         self.database_tree.refresh()
 
@@ -410,5 +588,7 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event):
         """Handle window close event."""
         if self.connector:
+            if self._query_editor is not None:
+                self._query_editor.cancel_query()
             self.connector.disconnect()
         event.accept()
@@ -4,36 +4,76 @@ SQL query editor widget.
 
 import logging
 import csv
+import itertools
 import json
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
-    QPlainTextEdit, QTableWidget, QTableWidgetItem,
+    QPlainTextEdit, QTableView,
     QPushButton, QLabel, QTextEdit, QFileDialog,
-    QHeaderView, QMessageBox
+    QHeaderView, QMessageBox, QApplication, QProgressDialog
 )
-from PySide6.QtCore import Qt, Signal, Slot
+from PySide6.QtCore import Qt, Signal, Slot, QThreadPool
 from PySide6.QtGui import QFont
 
 from app.core.connectors import BaseConnector, QueryResult
+from app.core.query_worker import QueryWorker
+from app.ui.table_model import RowsModel
 from app.utils.sql_highlighter import SQLSyntaxHighlighter
 
+# Optional: orjson encodes JSON exports in native code
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Monospace editor font shared by all editors; QFont needs a running
+# QGuiApplication, so it is created on first use
+_EDITOR_FONT: Optional[QFont] = None
+
+
+def _editor_font() -> QFont:
+    """Get the shared editor font."""
+    global _EDITOR_FONT
+    if _EDITOR_FONT is None:
+        _EDITOR_FONT = QFont("Consolas", 12)
+        _EDITOR_FONT.setStyleHint(QFont.Monospace)
+    return _EDITOR_FONT
+
 
 class QueryEditor(QWidget):
     """
     SQL query editor with syntax highlighting and result display.
 
+    Queries run on the global QThreadPool; a running query can be stopped
+    with cancel_query().
+
     Signals:
         query_executed(dict): Emitted when query execution completes
         execute_requested(): Emitted when execute is requested
+        query_running(bool): Emitted when a query starts (True) or ends (False)
     """
 
     query_executed = Signal(dict)
     execute_requested = Signal()
+    query_running = Signal(bool)
+
+    # Columns are sized to their header and the first RESIZE_SAMPLE_ROWS rows
+    RESIZE_SAMPLE_ROWS = 50
+    DEFAULT_COLUMN_WIDTH = 150
+    MAX_COLUMN_WIDTH = 400
+    # Horizontal cell padding added to measured text widths, in pixels
+    CELL_PADDING = 16
+
+    # Rows written per batch (and per progress update) when exporting
+    EXPORT_BATCH_SIZE = 10000
+    # Write buffer of the export file
+    EXPORT_BUFFER_SIZE = 8 * 1024 * 1024
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -41,6 +81,16 @@ class QueryEditor(QWidget):
         self.connector: Optional[BaseConnector] = None
         self.last_result: Optional[QueryResult] = None
 
+        # State of the running query; _cancel_event is None when idle
+        self._cancel_event: Optional[threading.Event] = None
+        self._running_query = ""
+        self._running_connector: Optional[BaseConnector] = None
+
+        # Running export; None when idle
+        self._export_dialog: Optional[QProgressDialog] = None
+        self._export_cancel: Optional[threading.Event] = None
+        self._export_path: Optional[Path] = None
+
         self._setup_ui()
 
     def _setup_ui(self):
@@ -64,12 +114,12 @@ class QueryEditor(QWidget):
         editor_header.addStretch()
 
         self.btn_execute = QPushButton("Execute (F5)")
-        self.btn_execute.clicked.connect(self.execute_query)
+        self.btn_execute.clicked.connect(self.execute_query, Qt.UniqueConnection)
         editor_header.addWidget(self.btn_execute)
 
         self.btn_clear = QPushButton("Clear")
         self.btn_clear.setProperty("secondary", "true")
-        self.btn_clear.clicked.connect(self.clear)
+        self.btn_clear.clicked.connect(self.clear, Qt.UniqueConnection)
         editor_header.addWidget(self.btn_clear)
 
         editor_layout.addLayout(editor_header)
@@ -77,11 +127,13 @@ class QueryEditor(QWidget):
         # SQL editor
         self.editor = QPlainTextEdit()
         self.editor.setPlaceholderText("Enter SQL query here...\nExample: SELECT * FROM table_name LIMIT 100")
-        font = QFont("Consolas", 12)
-        font.setStyleHint(QFont.Monospace)
-        self.editor.setFont(font)
+        self.editor.setFont(_editor_font())
         self.editor.setTabStopDistance(40)  # 4 spaces
 
+        # Stripped editor text, dropped whenever the document changes
+        self._query_text: Optional[str] = None
+        self.editor.document().contentsChanged.connect(self._on_query_text_changed)
+
         # Syntax highlighter
         self.highlighter = SQLSyntaxHighlighter(self.editor.document())
 
@@ -108,17 +160,22 @@ class QueryEditor(QWidget):
 
         self.btn_export = QPushButton("Export")
         self.btn_export.setProperty("secondary", "true")
-        self.btn_export.clicked.connect(self.export_results)
+        self.btn_export.clicked.connect(self.export_results, Qt.UniqueConnection)
         self.btn_export.setEnabled(False)
         results_header.addWidget(self.btn_export)
 
         results_layout.addLayout(results_header)
 
-        # Results table
-        self.results_table = QTableWidget()
+        # Results table; cells are rendered lazily by the model
+        self._model = RowsModel(self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self._model)
         self.results_table.setAlternatingRowColors(True)
-        self.results_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.results_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.results_table.setEditTriggers(QTableView.NoEditTriggers)
+        self.results_table.setSelectionBehavior(QTableView.SelectRows)
+        self.results_table.setTextElideMode(Qt.ElideRight)
+        self.results_table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.results_table.horizontalHeader().setDefaultSectionSize(self.DEFAULT_COLUMN_WIDTH)
         results_layout.addWidget(self.results_table)
 
         # Error display
@@ -139,21 +196,40 @@ class QueryEditor(QWidget):
 
     def set_connector(self, connector: BaseConnector):
         """Set the database connector."""
+        self.cancel_query()
         self.connector = connector
 
+    def is_running(self) -> bool:
+        """Check whether a query is running."""
+        return self._cancel_event is not None
+
+    @Slot()
+    def cancel_query(self):
+        """Abort the running query, if any."""
+        if self._cancel_event is not None and not self._cancel_event.is_set():
+            self._cancel_event.set()
+            logger.info("Query cancellation requested")
+
     def set_query(self, query: str):
         """Set the query text."""
         self.editor.setPlainText(query)
 
     def get_query(self) -> str:
-        """Get the current query text."""
-        return self.editor.toPlainText().strip()
+        """Get the current query text; the document is only read again after an edit."""
+        if self._query_text is None:
+            self._query_text = self.editor.toPlainText().strip()
+        return self._query_text
+
+    @Slot()
+    def _on_query_text_changed(self):
+        """Drop the cached query text."""
+        self._query_text = None
 
+    @Slot()
     def clear(self):
         """Clear the editor and results."""
         self.editor.clear()
-        self.results_table.setRowCount(0)
-        self.results_table.setColumnCount(0)
+        self._model.clear()
         self.error_text.clear()
         self.error_text.hide()
         self.results_label.setText("Results")
@@ -168,6 +244,9 @@ class QueryEditor(QWidget):
             self._show_error("No database connected")
             return
 
+        if self.is_running():
+            return
+
         query = self.get_query()
         if not query:
             self._show_error("Please enter a query")
@@ -175,37 +254,73 @@ class QueryEditor(QWidget):
 
         # Clear previous results
         self.error_text.hide()
-        self.results_table.setRowCount(0)
-
-        try:
-            result = self.connector.execute_query(query)
-            self.last_result = result
-
-            if result.success:
-                self._display_result(result)
-                self.query_executed.emit({
-                    'success': True,
-                    'execution_time': result.execution_time,
-                    'row_count': result.row_count,
-                    'query': query,
-                })
-                logger.info(f"Query executed: {result.row_count} rows in {result.execution_time:.3f}s")
-            else:
-                self._show_error(result.error or "Unknown error")
-                self.query_executed.emit({
-                    'success': False,
-                    'error': result.error,
-                    'query': query,
-                })
-
-        except Exception as e:
-            self._show_error(str(e))
+        self._model.clear()
+
+        self._cancel_event = threading.Event()
+        self._running_query = query
+        self._running_connector = self.connector
+
+        worker = QueryWorker(self.connector.execute_query, query, cancel=self._cancel_event)
+        worker.signals.result.connect(self._on_query_finished)
+        worker.signals.error.connect(self._on_query_error)
+        worker.signals.finished.connect(self._on_query_done)
+
+        self.btn_execute.setEnabled(False)
+        self.results_label.setText("Executing...")
+        QApplication.setOverrideCursor(Qt.BusyCursor)
+        self.query_running.emit(True)
+        QThreadPool.globalInstance().start(worker)
+
+    @Slot(object)
+    def _on_query_finished(self, result: QueryResult):
+        """Display the result of the query run in the background."""
+        # The database was switched while the query ran
+        if self._running_connector is not self.connector:
+            return
+
+        query = self._running_query
+        self.last_result = result
+
+        if result.success:
+            self._display_result(result)
+            self.query_executed.emit({
+                'success': True,
+                'execution_time': result.execution_time,
+                'row_count': result.row_count,
+                'query': query,
+            })
+            logger.info(f"Query executed: {result.row_count} rows in {result.execution_time:.3f}s")
+        else:
+            self._show_error(result.error or "Unknown error")
             self.query_executed.emit({
                 'success': False,
-                'error': str(e),
+                'error': result.error,
                 'query': query,
             })
-            logger.error(f"Query execution failed: {e}")
+
+    @Slot(str)
+    def _on_query_error(self, message: str):
+        """Handle an exception raised while running the query."""
+        if self._running_connector is not self.connector:
+            return
+
+        self._show_error(message)
+        self.query_executed.emit({
+            'success': False,
+            'error': message,
+            'query': self._running_query,
+        })
+        logger.error(f"Query execution failed: {message}")
+
+    @Slot()
+    def _on_query_done(self):
+        """Reset the running state once the background query has ended."""
+        QApplication.restoreOverrideCursor()
+        self._cancel_event = None
+        self._running_query = ""
+        self._running_connector = None
+        self.btn_execute.setEnabled(True)
+        self.query_running.emit(False)
 
     def _display_result(self, result: QueryResult):
         """Display query result in table."""
@@ -213,25 +328,38 @@ class QueryEditor(QWidget):
         self.results_label.setText(f"Results ({result.row_count:,} rows)")
         self.time_label.setText(f"Execution time: {result.execution_time:.3f}s")
 
-        # Setup columns
-        self.results_table.setColumnCount(len(result.columns))
-        self.results_table.setHorizontalHeaderLabels(result.columns)
-
-        # Populate data
-        self.results_table.setRowCount(len(result.rows))
-        for row_idx, row in enumerate(result.rows):
-            for col_idx, value in enumerate(row):
-                item = QTableWidgetItem(str(value) if value is not None else "NULL")
-                if value is None:
-                    item.setForeground(Qt.gray)
-                self.results_table.setItem(row_idx, col_idx, item)
+        # The model keeps the result rows; only visible cells are formatted
+        self._model.set_result(result)
+        self.results_table.scrollToTop()
 
-        # Resize columns
-        self.results_table.resizeColumnsToContents()
+        self._fit_columns(result)
 
         # Enable export
         self.btn_export.setEnabled(result.row_count > 0)
 
+    def _fit_columns(self, result: QueryResult):
+        """
+        Size result columns from a sample of rows.
+
+        Unlike resizeColumnsToContents(), which lays out every cell, only the
+        header and the first RESIZE_SAMPLE_ROWS rows are measured. Widths are
+        capped at MAX_COLUMN_WIDTH.
+        """
+        header = self.results_table.horizontalHeader()
+        header_advance = header.fontMetrics().horizontalAdvance
+        cell_advance = self.results_table.fontMetrics().horizontalAdvance
+        display_text = RowsModel.display_text
+
+        widths = [header_advance(str(name)) for name in result.columns]
+        for row in itertools.islice(result.iter_rows(), self.RESIZE_SAMPLE_ROWS):
+            for col, value in enumerate(row):
+                width = cell_advance(display_text(value))
+                if width > widths[col]:
+                    widths[col] = width
+
+        for col, width in enumerate(widths):
+            header.resizeSection(col, min(width + self.CELL_PADDING, self.MAX_COLUMN_WIDTH))
+
     def _show_error(self, error: str):
         """Display error message."""
         self.error_text.setText(f"Error: {error}")
@@ -246,6 +374,9 @@ class QueryEditor(QWidget):
         if not self.last_result or not self.last_result.success:
             return
 
+        if self._export_dialog is not None:
+            return
+
         file_path, selected_filter = QFileDialog.getSaveFileName(
             self,
             "Export Results",
@@ -256,47 +387,161 @@ class QueryEditor(QWidget):
         if not file_path:
             return
 
-        try:
-            path = Path(file_path)
-            if path.suffix.lower() == '.json':
-                self._export_json(path)
-            else:
-                self._export_csv(path)
-
-            QMessageBox.information(
-                self,
-                "Export Complete",
-                f"Results exported to:\n{file_path}"
-            )
-            logger.info(f"Exported results to {file_path}")
-
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Export Error",
-                f"Failed to export results:\n{e}"
-            )
-            logger.error(f"Export failed: {e}")
-
-    def _export_csv(self, path: Path):
-        """Export results to CSV."""
-        with open(path, 'w', newline='', encoding='utf-8') as f:
+        path = Path(file_path)
+        export = self._export_json if path.suffix.lower() == '.json' else self._export_csv
+        result = self.last_result
+
+        # The file is written on the thread pool; the dialog reports progress
+        self._export_path = path
+        self._export_cancel = threading.Event()
+        self._export_dialog = QProgressDialog(
+            "Exporting results...", "Cancel", 0, max(result.row_count, 1), self
+        )
+        self._export_dialog.setWindowTitle("Export Results")
+        self._export_dialog.setWindowModality(Qt.WindowModal)
+        self._export_dialog.setMinimumDuration(500)
+        self._export_dialog.canceled.connect(self._export_cancel.set)
+
+        worker = QueryWorker(export, path, result, cancel=self._export_cancel)
+        worker.kwargs['progress'] = worker.signals.progress.emit
+        worker.signals.progress.connect(self._export_dialog.setValue)
+        worker.signals.result.connect(self._on_export_finished)
+        worker.signals.error.connect(self._on_export_error)
+        worker.signals.finished.connect(self._on_export_done)
+        QThreadPool.globalInstance().start(worker)
+
+    @Slot(object)
+    def _on_export_finished(self, row_count: int):
+        """Report a completed (or cancelled) export."""
+        # The message box runs a nested event loop in which _on_export_done()
+        # clears the export state, so keep the path
+        path = self._export_path
+        if self._export_cancel.is_set():
+            path.unlink(missing_ok=True)
+            logger.info(f"Export to {path} cancelled")
+            return
+
+        QMessageBox.information(
+            self,
+            "Export Complete",
+            f"Results exported to:\n{path}"
+        )
+        logger.info(f"Exported {row_count} rows to {path}")
+
+    @Slot(str)
+    def _on_export_error(self, message: str):
+        """Report a failed export."""
+        QMessageBox.critical(
+            self,
+            "Export Error",
+            f"Failed to export results:\n{message}"
+        )
+        logger.error(f"Export failed: {message}")
+
+    @Slot()
+    def _on_export_done(self):
+        """Close the progress dialog once the export has ended."""
+        self._export_dialog.reset()
+        self._export_dialog.deleteLater()
+        self._export_dialog = None
+        self._export_cancel = None
+        self._export_path = None
+
+    @classmethod
+    def _export_csv(
+        cls,
+        path: Path,
+        result: QueryResult,
+        progress: Optional[Callable[[int], None]] = None,
+        cancel: Optional[threading.Event] = None
+    ) -> int:
+        """
+        Export results to CSV; runs on a thread pool thread.
+
+        Rows are written with csv.writer in batches of EXPORT_BATCH_SIZE,
+        checking for cancellation and reporting progress after each batch.
+
+        Returns:
+            Number of rows written
+        """
+        written = 0
+        rows = result.iter_rows()
+
+        with open(path, 'w', newline='', encoding='utf-8',
+                  buffering=cls.EXPORT_BUFFER_SIZE) as f:
             writer = csv.writer(f)
-            writer.writerow(self.last_result.columns)
-            writer.writerows(self.last_result.rows)
-
-    def _export_json(self, path: Path):
-        """Export results to JSON."""
-        data = []
-        for row in self.last_result.rows:
-            record = {}
-            for col_idx, col_name in enumerate(self.last_result.columns):
-                value = row[col_idx]
-                # Convert non-serializable types
-                if isinstance(value, bytes):
-                    value = value.hex()
-                record[col_name] = value
-            data.append(record)
-
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            writer.writerow(result.columns)
+
+            while True:
+                if cancel is not None and cancel.is_set():
+                    break
+                batch = list(itertools.islice(rows, cls.EXPORT_BATCH_SIZE))
+                if not batch:
+                    break
+                writer.writerows(batch)
+                written += len(batch)
+                if progress is not None:
+                    progress(written)
+
+        return written
+
+    @staticmethod
+    def _json_default(value: Any) -> str:
+        """Convert values JSON cannot encode: bytes as hex, the rest via str()."""
+        if isinstance(value, (bytes, bytearray)):
+            return value.hex()
+        return str(value)
+
+    @classmethod
+    def _export_json(
+        cls,
+        path: Path,
+        result: QueryResult,
+        progress: Optional[Callable[[int], None]] = None,
+        cancel: Optional[threading.Event] = None
+    ) -> int:
+        """
+        Export results to JSON; runs on a thread pool thread.
+
+        Records are encoded and written one batch of EXPORT_BATCH_SIZE at a
+        time, so neither all records nor the full JSON document are held in
+        memory. The output has the layout of json.dump(records, indent=2).
+        Batches are encoded with orjson when it is installed, falling back to
+        the json module for values orjson rejects (e.g. integers over 64 bits).
+
+        Returns:
+            Number of rows written
+        """
+        encoder = json.JSONEncoder(indent=2, ensure_ascii=False, default=cls._json_default)
+        columns = tuple(result.columns)
+        rows = result.iter_rows()
+        written = 0
+
+        def encode(batch: list) -> bytes:
+            if orjson is not None:
+                try:
+                    return orjson.dumps(batch, default=cls._json_default, option=orjson.OPT_INDENT_2)
+                except orjson.JSONEncodeError:
+                    pass
+            return encoder.encode(batch).encode('utf-8')
+
+        with open(path, 'wb', buffering=cls.EXPORT_BUFFER_SIZE) as f:
+            while True:
+                if cancel is not None and cancel.is_set():
+                    break
+
+                batch = [dict(zip(columns, row))
+                         for row in itertools.islice(rows, cls.EXPORT_BATCH_SIZE)]
+                if not batch:
+                    break
+
+                # Splice the batch's list body into the file's top-level list
+                f.write(b",\n  " if written else b"[\n  ")
+                f.write(encode(batch)[4:-2])
+                written += len(batch)
+                if progress is not None:
+                    progress(written)
+
+            f.write(b"\n]" if written else b"[]")
+
+        return written
@@ -3,18 +3,126 @@ Schema viewer widget for displaying table schema information.
 """
 
 import logging
-from typing import Optional
+from operator import attrgetter
+from typing import Any, Callable, Optional, Sequence, Tuple
 
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView,
     QLabel, QTextEdit, QSplitter, QGroupBox, QHeaderView
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QBrush
 
-from app.core.connectors import TableSchema
+from app.core.connectors import ColumnInfo, IndexInfo, TableSchema
 
 logger = logging.getLogger(__name__)
 
+# Bound once; Qt enum attribute lookups are slow in PySide6
+_DISPLAY_ROLE = Qt.DisplayRole
+_BACKGROUND_ROLE = Qt.BackgroundRole
+
+# Flag cell texts; one shared object each, returned as is by data()
+_YES = "YES"
+_NO = "NO"
+_EMPTY = ""
+
+
+class _SchemaListModel(QAbstractTableModel):
+    """
+    Read-only table model over a list of schema entries.
+
+    The model is built from (header, getter) pairs; a getter returns the
+    text of its column for one entry. set_entries() runs the getters once
+    into one tuple of cell texts per column, so data() is a single tuple
+    lookup and no item objects are created per cell.
+    """
+
+    def __init__(self, columns: Sequence[Tuple[str, Callable[[Any], str]]], parent=None):
+        super().__init__(parent)
+        self._headers = [header for header, _ in columns]
+        self._getters = [getter for _, getter in columns]
+        self._entries: Sequence = []
+        self._cells: Tuple[Tuple[str, ...], ...] = tuple(() for _ in columns)
+
+    def set_entries(self, entries: Sequence):
+        """Replace the displayed entries."""
+        self.beginResetModel()
+        self._entries = entries
+        self._cells = tuple(
+            tuple(map(getter, entries)) for getter in self._getters
+        )
+        self.endResetModel()
+
+    def clear(self):
+        """Remove all entries; an empty model is left as is, without a reset."""
+        if self._entries:
+            self.set_entries([])
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Get the number of entries."""
+        return 0 if parent.isValid() else len(self._entries)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Get the number of columns."""
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        """Get the text of a cell."""
+        if role != _DISPLAY_ROLE or not index.isValid():
+            return None
+        return self._cells[index.column()][index.row()]
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        """Get the column titles and 1-based row numbers for the headers."""
+        if role != _DISPLAY_ROLE:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._headers[section]
+        return str(section + 1)
+
+
+class ColumnsModel(_SchemaListModel):
+    """Table model over a table's ColumnInfo list; primary key rows are highlighted."""
+
+    COLUMNS = (
+        ("Column", attrgetter("name")),
+        ("Type", attrgetter("data_type")),
+        ("Nullable", lambda col: _YES if col.nullable else _NO),
+        ("Default", lambda col: col.default_value or _EMPTY),
+        ("PK", lambda col: _YES if col.is_primary_key else _EMPTY),
+        ("FK", lambda col: col.foreign_key or _EMPTY),
+    )
+
+    PRIMARY_KEY_BRUSH = QBrush(Qt.darkBlue)
+
+    def __init__(self, parent=None):
+        super().__init__(self.COLUMNS, parent)
+        self._primary_keys: Tuple[bool, ...] = ()
+
+    def set_entries(self, entries: Sequence[ColumnInfo]):
+        """Replace the displayed columns."""
+        self._primary_keys = tuple(col.is_primary_key for col in entries)
+        super().set_entries(entries)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        """Get the text of a cell, or the background of primary key rows."""
+        if role == _BACKGROUND_ROLE and index.isValid():
+            return self.PRIMARY_KEY_BRUSH if self._primary_keys[index.row()] else None
+        return super().data(index, role)
+
+
+class IndexesModel(_SchemaListModel):
+    """Table model over a table's IndexInfo list."""
+
+    COLUMNS = (
+        ("Index Name", attrgetter("name")),
+        ("Columns", lambda idx: ", ".join(idx.columns)),
+        ("Unique", lambda idx: _YES if idx.is_unique else _EMPTY),
+    )
+
+    def __init__(self, parent=None):
+        super().__init__(self.COLUMNS, parent)
+
 
 class SchemaViewer(QWidget):
     """
@@ -26,6 +134,9 @@ class SchemaViewer(QWidget):
     - Table DDL (CREATE TABLE statement)
     """
 
+    # Rows measured by ResizeToContents columns (Qt's default is 1000)
+    RESIZE_PRECISION = 20
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -58,20 +169,19 @@ class SchemaViewer(QWidget):
         columns_layout = QVBoxLayout(columns_group)
         columns_layout.setContentsMargins(4, 4, 4, 4)
 
-        self.columns_table = QTableWidget()
-        self.columns_table.setColumnCount(6)
-        self.columns_table.setHorizontalHeaderLabels([
-            "Column", "Type", "Nullable", "Default", "PK", "FK"
-        ])
+        self.columns_model = ColumnsModel(self)
+        self.columns_table = QTableView()
+        self.columns_table.setModel(self.columns_model)
         self.columns_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
         self.columns_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
         self.columns_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeToContents)
         self.columns_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeToContents)
         self.columns_table.horizontalHeader().setSectionResizeMode(4, QHeaderView.ResizeToContents)
         self.columns_table.horizontalHeader().setSectionResizeMode(5, QHeaderView.ResizeToContents)
+        self.columns_table.horizontalHeader().setResizeContentsPrecision(self.RESIZE_PRECISION)
         self.columns_table.setAlternatingRowColors(True)
-        self.columns_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.columns_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.columns_table.setEditTriggers(QTableView.NoEditTriggers)
+        self.columns_table.setSelectionBehavior(QTableView.SelectRows)
         columns_layout.addWidget(self.columns_table)
 
         top_layout.addWidget(columns_group, 3)
@@ -81,15 +191,16 @@ class SchemaViewer(QWidget):
         indexes_layout = QVBoxLayout(indexes_group)
         indexes_layout.setContentsMargins(4, 4, 4, 4)
 
-        self.indexes_table = QTableWidget()
-        self.indexes_table.setColumnCount(3)
-        self.indexes_table.setHorizontalHeaderLabels(["Index Name", "Columns", "Unique"])
+        self.indexes_model = IndexesModel(self)
+        self.indexes_table = QTableView()
+        self.indexes_table.setModel(self.indexes_model)
         self.indexes_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
         self.indexes_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
         self.indexes_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeToContents)
+        self.indexes_table.horizontalHeader().setResizeContentsPrecision(self.RESIZE_PRECISION)
         self.indexes_table.setAlternatingRowColors(True)
-        self.indexes_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.indexes_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.indexes_table.setEditTriggers(QTableView.NoEditTriggers)
+        self.indexes_table.setSelectionBehavior(QTableView.SelectRows)
         indexes_layout.addWidget(self.indexes_table)
 
         top_layout.addWidget(indexes_group, 2)
@@ -119,9 +230,14 @@ class SchemaViewer(QWidget):
         """
         Set the schema to display.
 
+        The connector caches schemas per data version, so selecting the
+        displayed table again passes the same object; it is not rebuilt.
+
         Args:
             schema: TableSchema object
         """
+        if schema is not None and schema is self.schema:
+            return
         self.schema = schema
         self._update_display()
 
@@ -129,8 +245,8 @@ class SchemaViewer(QWidget):
         """Clear the schema display."""
         self.schema = None
         self.header_label.setText("Select a table to view its schema")
-        self.columns_table.setRowCount(0)
-        self.indexes_table.setRowCount(0)
+        self.columns_model.clear()
+        self.indexes_model.clear()
         self.ddl_text.clear()
 
     def _update_display(self):
@@ -145,29 +261,11 @@ class SchemaViewer(QWidget):
             f"Table: {self.schema.name} ({row_count:,} rows)"
         )
 
-        # Update columns table
-        self.columns_table.setRowCount(len(self.schema.columns))
-        for row, col in enumerate(self.schema.columns):
-            self.columns_table.setItem(row, 0, QTableWidgetItem(col.name))
-            self.columns_table.setItem(row, 1, QTableWidgetItem(col.data_type))
-            self.columns_table.setItem(row, 2, QTableWidgetItem("YES" if col.nullable else "NO"))
-            self.columns_table.setItem(row, 3, QTableWidgetItem(col.default_value or ""))
-            self.columns_table.setItem(row, 4, QTableWidgetItem("YES" if col.is_primary_key else ""))
-            self.columns_table.setItem(row, 5, QTableWidgetItem(col.foreign_key or ""))
-
-            # Highlight primary key rows
-            if col.is_primary_key:
-                for c in range(6):
-                    item = self.columns_table.item(row, c)
-                    if item:
-                        item.setBackground(Qt.darkBlue)
-
-        # Update indexes table
-        self.indexes_table.setRowCount(len(self.schema.indexes))
-        for row, idx in enumerate(self.schema.indexes):
-            self.indexes_table.setItem(row, 0, QTableWidgetItem(idx.name))
-            self.indexes_table.setItem(row, 1, QTableWidgetItem(", ".join(idx.columns)))
-            self.indexes_table.setItem(row, 2, QTableWidgetItem("YES" if idx.is_unique else ""))
+        # Update columns and indexes tables. Each model emits a single reset
+        # and Qt coalesces the repaints, so updates are not suspended here
+        # (setUpdatesEnabled(False) around this block measured slower).
+        self.columns_model.set_entries(self.schema.columns)
+        self.indexes_model.set_entries(self.schema.indexes)
 
         # Update DDL
         self.ddl_text.setText(self.schema.ddl or "DDL not available")
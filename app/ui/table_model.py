@@ -0,0 +1,185 @@
+"""
+Table model for displaying query result rows.
+"""
+
+from typing import List, Optional, Sequence
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QBrush
+
+from app.core.connectors import QueryResult
+
+# Qt enum attribute lookups cost microseconds each in PySide6; data() runs
+# for every painted cell, so it compares against these bound values
+_DISPLAY_ROLE = Qt.DisplayRole
+_TOOLTIP_ROLE = Qt.ToolTipRole
+_FOREGROUND_ROLE = Qt.ForegroundRole
+_TEXT_ALIGNMENT_ROLE = Qt.TextAlignmentRole
+
+
+class RowsModel(QAbstractTableModel):
+    """
+    Read-only table model over query result rows or columns.
+
+    Values are kept in the layout the connector returned them in (rows or
+    column_data) and looked up on demand in data(), so only the cells
+    visible in the view are ever converted for display. Every value,
+    numbers included, is shown as the text display_text() gives; the
+    value's type only decides the alignment.
+
+    When new data has the same columns as the current data (paging or
+    re-sorting the same table), rows are inserted/removed and changed in
+    place instead of resetting the model, so the header keeps its sections
+    and the user's column widths.
+    """
+
+    NULL_TEXT = "NULL"
+
+    # Longest text shown in a cell; the full value is in the tooltip
+    MAX_CELL_CHARS = 200
+
+    # Roles answered by data(); views also ask for font, background,
+    # decoration and check state of every painted cell
+    _ROLES = frozenset((
+        _DISPLAY_ROLE, _TOOLTIP_ROLE, _FOREGROUND_ROLE, _TEXT_ALIGNMENT_ROLE
+    ))
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._columns: List[str] = []
+        self._rows: Sequence[tuple] = []
+        self._column_data: Optional[List[list]] = None
+        self._row_count = 0
+        self._null_brush = QBrush(Qt.gray)
+        self._numeric_alignment = int(Qt.AlignRight | Qt.AlignVCenter)
+
+    def set_rows(self, columns: List[str], rows: Sequence[tuple]):
+        """
+        Replace the displayed data.
+
+        Args:
+            columns: Column names
+            rows: Result rows as tuples
+        """
+        self._replace(columns, rows, None, len(rows))
+
+    def set_result(self, result: QueryResult):
+        """
+        Replace the displayed data with a query result of either layout.
+
+        Args:
+            result: QueryResult with rows or column_data
+        """
+        if result.column_data is None:
+            self.set_rows(result.columns, result.rows)
+            return
+
+        self._replace(result.columns, [], result.column_data, result.row_count)
+
+    def _replace(self, columns: List[str], rows: Sequence[tuple],
+                 column_data: Optional[List[list]], row_count: int):
+        """Swap in new data, resetting the model only if the columns changed."""
+        columns = list(columns)
+        if not columns or columns != self._columns:
+            self.beginResetModel()
+            self._columns = columns
+            self._rows = rows
+            self._column_data = column_data
+            self._row_count = row_count
+            self.endResetModel()
+            return
+
+        old_count = self._row_count
+
+        # Shrink while the old data still backs the remaining rows
+        if row_count < old_count:
+            self.beginRemoveRows(QModelIndex(), row_count, old_count - 1)
+            self._row_count = row_count
+            self.endRemoveRows()
+
+        self._rows = rows
+        self._column_data = column_data
+
+        if row_count > old_count:
+            self.beginInsertRows(QModelIndex(), old_count, row_count - 1)
+            self._row_count = row_count
+            self.endInsertRows()
+
+        changed = min(old_count, row_count)
+        if changed:
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(changed - 1, len(columns) - 1)
+            )
+
+    def clear(self):
+        """Remove all columns and rows."""
+        self.set_rows([], [])
+
+    def column_name(self, column: int) -> str:
+        """Get the name of a column."""
+        return self._columns[column]
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Get the number of rows."""
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Get the number of columns."""
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        """Get the data for a cell."""
+        # Other roles are answered before the value is looked up
+        if role not in self._ROLES or not index.isValid():
+            return None
+
+        if self._column_data is not None:
+            value = self._column_data[index.column()][index.row()]
+        else:
+            value = self._rows[index.row()][index.column()]
+
+        if role == _DISPLAY_ROLE:
+            # Numbers are shown as str() shows them too: Qt would format a
+            # float with 6 significant digits and group integer digits
+            return self.display_text(value)
+
+        if role == _TOOLTIP_ROLE:
+            if isinstance(value, str) and len(value) > self.MAX_CELL_CHARS:
+                return value
+            return None
+
+        if role == _FOREGROUND_ROLE:
+            return self._null_brush if value is None else None
+
+        if role == _TEXT_ALIGNMENT_ROLE:
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                return self._numeric_alignment
+            return None
+
+        return None
+
+    @classmethod
+    def display_text(cls, value) -> str:
+        """
+        Get the text shown in a cell for a value.
+
+        Long text is cut to MAX_CELL_CHARS and binary values are shown as
+        their size, so a cell never lays out a large string.
+        """
+        if value is None:
+            return cls.NULL_TEXT
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return f"<{len(value)} bytes>"
+        text = str(value)
+        if len(text) > cls.MAX_CELL_CHARS:
+            return text[:cls.MAX_CELL_CHARS] + "…"
+        return text
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        """Get column names and 1-based row numbers for the headers."""
+        if role != Qt.DisplayRole:
+            return None
+
+        if orientation == Qt.Horizontal:
+            return self._columns[section] if section < len(self._columns) else None
+        return str(section + 1)
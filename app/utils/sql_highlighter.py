@@ -2,16 +2,26 @@
 SQL syntax highlighter for QPlainTextEdit.
 """
 
-import re
-from PySide6.QtGui import QSyntaxHighlighter, QTextCharFormat, QColor, QFont
-from PySide6.QtCore import Qt
+from PySide6.QtGui import QSyntaxHighlighter, QTextCharFormat, QTextCursor, QColor, QFont
+from PySide6.QtCore import Qt, Slot, QTimer
 
 
 class SQLSyntaxHighlighter(QSyntaxHighlighter):
     """
     Syntax highlighter for SQL with VS Code Dark+ theme colors.
+
+    Text formats and token lookup tables are class-level and built once per
+    process, on the first instance.
+
+    An edit re-highlights only the edited blocks right away. If that changes
+    a block's multi-line comment state, the following blocks are re-highlighted
+    once typing pauses for RESTATE_DELAY_MS, so keystroke cost does not grow
+    with the length of the query.
     """
 
+    # Delay before re-highlighting blocks after a comment state change
+    RESTATE_DELAY_MS = 80
+
     # SQL keywords
     KEYWORDS = [
         'SELECT', 'FROM', 'WHERE', 'AND', 'OR', 'NOT', 'IN', 'IS', 'NULL',
@@ -52,121 +62,255 @@ class SQLSyntaxHighlighter(QSyntaxHighlighter):
         'DATE', 'DATETIME', 'TIMESTAMP',
     ]
 
+    # Multi-line comment delimiters
+    COMMENT_START = '/*'
+    COMMENT_END = '*/'
+
+    # Single-character operators
+    OPERATORS = '+-*/%=<>!&|~^'
+
+    # Characters that are never part of a highlighted token
+    INERT_CHARS = ' \t,;().'
+
+    # Lookup tables shared by all instances; see _init_rules()
+    word_formats = None
+    functions = None
+    operators = None
+    delimited = None
+    inert_table = None
+
     def __init__(self, document):
         super().__init__(document)
         self._init_formats()
         self._init_rules()
 
-    def _init_formats(self):
-        """Initialize text formats for different token types."""
+        # Start of the first block whose state change is deferred
+        self._restate_cursor = None
+        self._restating = False
+
+        self._restate_timer = QTimer(self)
+        self._restate_timer.setSingleShot(True)
+        self._restate_timer.setInterval(self.RESTATE_DELAY_MS)
+        self._restate_timer.timeout.connect(self._restate_blocks)
+
+    @classmethod
+    def _init_formats(cls):
+        """Initialize text formats for different token types (once per class)."""
+        if cls.word_formats is not None:
+            return
+
         # Keywords - Blue
-        self.keyword_format = QTextCharFormat()
-        self.keyword_format.setForeground(QColor("#569CD6"))
-        self.keyword_format.setFontWeight(QFont.Bold)
+        cls.keyword_format = QTextCharFormat()
+        cls.keyword_format.setForeground(QColor("#569CD6"))
+        cls.keyword_format.setFontWeight(QFont.Bold)
 
         # Functions - Yellow
-        self.function_format = QTextCharFormat()
-        self.function_format.setForeground(QColor("#DCDCAA"))
+        cls.function_format = QTextCharFormat()
+        cls.function_format.setForeground(QColor("#DCDCAA"))
 
         # Data types - Cyan
-        self.type_format = QTextCharFormat()
-        self.type_format.setForeground(QColor("#4EC9B0"))
+        cls.type_format = QTextCharFormat()
+        cls.type_format.setForeground(QColor("#4EC9B0"))
 
         # Strings - Orange
-        self.string_format = QTextCharFormat()
-        self.string_format.setForeground(QColor("#CE9178"))
+        cls.string_format = QTextCharFormat()
+        cls.string_format.setForeground(QColor("#CE9178"))
 
         # Numbers - Light green
-        self.number_format = QTextCharFormat()
-        self.number_format.setForeground(QColor("#B5CEA8"))
+        cls.number_format = QTextCharFormat()
+        cls.number_format.setForeground(QColor("#B5CEA8"))
 
         # Comments - Green
-        self.comment_format = QTextCharFormat()
-        self.comment_format.setForeground(QColor("#6A9955"))
-        self.comment_format.setFontItalic(True)
+        cls.comment_format = QTextCharFormat()
+        cls.comment_format.setForeground(QColor("#6A9955"))
+        cls.comment_format.setFontItalic(True)
 
         # Operators - Light gray
-        self.operator_format = QTextCharFormat()
-        self.operator_format.setForeground(QColor("#D4D4D4"))
+        cls.operator_format = QTextCharFormat()
+        cls.operator_format.setForeground(QColor("#D4D4D4"))
 
         # Identifiers (quoted) - Light blue
-        self.identifier_format = QTextCharFormat()
-        self.identifier_format.setForeground(QColor("#9CDCFE"))
-
-    def _init_rules(self):
-        """Initialize highlighting rules."""
-        self.rules = []
-
-        # Keywords
-        keyword_pattern = r'\b(' + '|'.join(self.KEYWORDS) + r')\b'
-        self.rules.append((re.compile(keyword_pattern, re.IGNORECASE), self.keyword_format))
-
-        # Functions
-        function_pattern = r'\b(' + '|'.join(self.FUNCTIONS) + r')\s*\('
-        self.rules.append((re.compile(function_pattern, re.IGNORECASE), self.function_format))
-
-        # Data types
-        type_pattern = r'\b(' + '|'.join(self.DATA_TYPES) + r')\b'
-        self.rules.append((re.compile(type_pattern, re.IGNORECASE), self.type_format))
-
-        # Numbers (integers and floats)
-        self.rules.append((re.compile(r'\b\d+\.?\d*\b'), self.number_format))
-
-        # Single-quoted strings
-        self.rules.append((re.compile(r"'[^']*'"), self.string_format))
-
-        # Double-quoted identifiers
-        self.rules.append((re.compile(r'"[^"]*"'), self.identifier_format))
-
-        # Backtick identifiers (MySQL style, also works in SQLite)
-        self.rules.append((re.compile(r'`[^`]*`'), self.identifier_format))
-
-        # Square bracket identifiers (SQL Server style)
-        self.rules.append((re.compile(r'\[[^\]]*\]'), self.identifier_format))
-
-        # Single-line comments: -- comment
-        self.rules.append((re.compile(r'--[^\n]*'), self.comment_format))
-
-        # Operators
-        self.rules.append((re.compile(r'[+\-*/%=<>!&|~^]'), self.operator_format))
+        cls.identifier_format = QTextCharFormat()
+        cls.identifier_format.setForeground(QColor("#9CDCFE"))
+
+    @classmethod
+    def _init_rules(cls):
+        """Build the word lookup tables and delimiter table (once per class)."""
+        if cls.word_formats is not None:
+            return
+
+        cls.functions = frozenset(cls.FUNCTIONS)
+        cls.operators = frozenset(cls.OPERATORS)
+        cls.inert_table = str.maketrans('', '', cls.INERT_CHARS)
+
+        # Opening character -> (closing character, format)
+        cls.delimited = {
+            "'": ("'", cls.string_format),     # Strings
+            '"': ('"', cls.identifier_format),  # Quoted identifiers
+            '`': ('`', cls.identifier_format),  # MySQL style, also works in SQLite
+            '[': (']', cls.identifier_format),  # SQL Server style
+        }
+
+        # Upper-case word -> format; a keyword wins over a data type of the
+        # same name. Set last: it marks the tables as built
+        word_formats = dict.fromkeys(cls.DATA_TYPES, cls.type_format)
+        word_formats.update(dict.fromkeys(cls.KEYWORDS, cls.keyword_format))
+        cls.word_formats = word_formats
 
     def highlightBlock(self, text):
         """Apply syntax highlighting to a block of text."""
-        # Apply each rule
-        for pattern, format in self.rules:
-            for match in pattern.finditer(text):
-                start = match.start()
-                length = match.end() - start
-                self.setFormat(start, length, format)
+        old_state = self.currentBlockState()
+
+        self._highlight_tokens(text)
 
         # Handle multi-line comments: /* ... */
         self._highlight_multiline_comments(text)
 
+        if not self._restating and self.currentBlockState() != old_state:
+            # Keep the old state so the following blocks are not re-highlighted now
+            self.setCurrentBlockState(old_state)
+            self._defer_restate()
+
+    def _highlight_tokens(self, text):
+        """
+        Highlight the tokens of a block in one left-to-right scan.
+
+        A token is classified by its first character: a word is looked up in
+        the function set (a function name only counts when followed by '(')
+        and then in the keyword and type table, a word starting with a digit is a number, quotes and
+        brackets extend to their closing character and '--' starts a comment.
+        An unclosed quote or bracket is not highlighted.
+
+        Spans are collected first and runs of adjacent spans with the same
+        format (e.g. '<>' or '||') are applied with a single setFormat call.
+        """
+        # Blank lines and lines of only punctuation such as '),' need no scan
+        if not text.translate(self.inert_table):
+            return
+
+        spans = []
+        add_span = spans.append
+        word_formats = self.word_formats
+        functions = self.functions
+        operators = self.operators
+        delimited = self.delimited
+        number_format = self.number_format
+        length = len(text)
+        i = 0
+
+        while i < length:
+            char = text[i]
+
+            if char.isalnum() or char == '_':
+                # Word: letters, digits and underscores
+                end = i + 1
+                while end < length and (text[end].isalnum() or text[end] == '_'):
+                    end += 1
+                word = text[i:end]
+
+                if char.isdecimal():
+                    if word.isdecimal():
+                        # Integer, or float when a dot and digits follow
+                        if end < length and text[end] == '.':
+                            frac_end = end + 1
+                            while frac_end < length and text[frac_end].isdecimal():
+                                frac_end += 1
+                            if frac_end < length and (text[frac_end].isalnum() or text[frac_end] == '_'):
+                                end += 1
+                            elif frac_end > end + 1:
+                                end = frac_end
+                        add_span((i, end - i, number_format))
+                else:
+                    upper = word.upper()
+                    if upper in functions:
+                        paren = end
+                        while paren < length and text[paren].isspace():
+                            paren += 1
+                        if paren < length and text[paren] == '(':
+                            add_span((i, paren + 1 - i, self.function_format))
+                            i = paren + 1
+                            continue
+                    format = word_formats.get(upper)
+                    if format is not None:
+                        add_span((i, end - i, format))
+                i = end
+                continue
+
+            if char in delimited:
+                closing, format = delimited[char]
+                end = text.find(closing, i + 1)
+                if end >= 0:
+                    add_span((i, end + 1 - i, format))
+                    i = end + 1
+                    continue
+            elif char == '-' and text.startswith('-', i + 1):
+                # Single-line comment: -- comment
+                add_span((i, length - i, self.comment_format))
+                break
+            elif char in operators:
+                add_span((i, 1, self.operator_format))
+            i += 1
+
+        if not spans:
+            return
+
+        set_format = self.setFormat
+        run_start, run_length, run_format = spans[0]
+        for start, span_length, format in spans[1:]:
+            if format is run_format and start == run_start + run_length:
+                run_length += span_length
+            else:
+                set_format(run_start, run_length, run_format)
+                run_start, run_length, run_format = start, span_length, format
+        set_format(run_start, run_length, run_format)
+
+    def _defer_restate(self):
+        """Schedule re-highlighting from the current block once typing pauses."""
+        position = self.currentBlock().position()
+        if self._restate_cursor is None or position < self._restate_cursor.position():
+            self._restate_cursor = QTextCursor(self.currentBlock())
+        self._restate_timer.start()
+
+    @Slot()
+    def _restate_blocks(self):
+        """Re-highlight from the first deferred block; Qt continues while states change."""
+        cursor, self._restate_cursor = self._restate_cursor, None
+        if cursor is None or self.document() is None:
+            return
+
+        self._restating = True
+        try:
+            self.rehighlightBlock(cursor.block())
+        finally:
+            self._restating = False
+
     def _highlight_multiline_comments(self, text):
         """Handle multi-line comment highlighting."""
-        start_pattern = re.compile(r'/\*')
-        end_pattern = re.compile(r'\*/')
+        start_marker = self.COMMENT_START
+        end_marker = self.COMMENT_END
 
         self.setCurrentBlockState(0)
 
-        start_index = 0
+        # Where to look for the end marker: past the start marker, so '/*/'
+        # does not close itself, or at 0 when the comment continues
+        start_index = search_index = 0
         if self.previousBlockState() != 1:
-            match = start_pattern.search(text)
-            start_index = match.start() if match else -1
+            start_index = text.find(start_marker)
+            search_index = start_index + len(start_marker)
 
         while start_index >= 0:
-            end_match = end_pattern.search(text, start_index)
+            end_index = text.find(end_marker, search_index)
 
-            if end_match is None:
+            if end_index < 0:
                 # Comment continues to next block
                 self.setCurrentBlockState(1)
                 comment_length = len(text) - start_index
             else:
                 # Comment ends in this block
-                comment_length = end_match.end() - start_index
+                comment_length = end_index + len(end_marker) - start_index
 
             self.setFormat(start_index, comment_length, self.comment_format)
 
             # Look for next comment start
-            match = start_pattern.search(text, start_index + comment_length)
-            start_index = match.start() if match else -1
+            start_index = text.find(start_marker, start_index + comment_length)
+            search_index = start_index + len(start_marker)
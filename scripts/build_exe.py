@@ -8,24 +8,34 @@ Usage:
     python scripts/build_exe.py
     python scripts/build_exe.py --clean
     python scripts/build_exe.py --debug
+    python scripts/build_exe.py --upx-dir C:\\tools\\upx
 """
 
 import argparse
+import hashlib
+import os
 import shutil
 import subprocess
 import sys
 from pathlib import Path
+from typing import Optional
 
 
 class EXEBuilder:
     """Automated PyInstaller build with validation."""
 
-    def __init__(self, project_root: Path, debug: bool = False):
+    # Files whose changes invalidate PyInstaller's cached analysis
+    ANALYSIS_INPUTS = ("LocalDBViewer.spec", "requirements.txt")
+
+    def __init__(self, project_root: Path, debug: bool = False,
+                 upx_dir: Optional[Path] = None):
         self.project_root = project_root
         self.debug = debug
+        self.upx_dir = upx_dir
         self.spec_file = project_root / "LocalDBViewer.spec"
         self.dist_dir = project_root / "dist"
         self.build_dir = project_root / "build"
+        self.analysis_hash_file = self.build_dir / ".analysis_hash"
 
     def pre_check(self) -> bool:
         """Verify preconditions for build."""
@@ -67,46 +77,91 @@ class EXEBuilder:
             print("ERROR: PySide6 not installed. Run: pip install PySide6")
             return False
 
+        # Check UPX is available (optional, compresses the bundled binaries)
+        if self.upx_dir is not None:
+            if not self.upx_dir.is_dir():
+                print(f"ERROR: UPX directory not found: {self.upx_dir}")
+                return False
+            print(f"  [OK] UPX: {self.upx_dir}")
+        elif shutil.which("upx"):
+            print(f"  [OK] UPX: {shutil.which('upx')}")
+        else:
+            print("WARNING: UPX not found, the EXE will not be compressed")
+
         print()
         return True
 
     def clean_build(self):
-        """Remove previous build artifacts."""
+        """
+        Remove previous build output.
+
+        The PyInstaller work directory (build/) is kept so its analysis
+        cache can be reused; build() passes --clean when it is stale.
+        """
         print("=== Cleaning previous build ===")
 
         if self.dist_dir.exists():
             print(f"  Removing: {self.dist_dir}")
             shutil.rmtree(self.dist_dir)
 
-        if self.build_dir.exists():
-            print(f"  Removing: {self.build_dir}")
-            shutil.rmtree(self.build_dir)
-
         print()
 
+    def _analysis_hash(self) -> str:
+        """Hash the inputs of PyInstaller's analysis and the interpreter."""
+        digest = hashlib.sha256(sys.version.encode("utf-8"))
+        for name in self.ANALYSIS_INPUTS:
+            path = self.project_root / name
+            if path.exists():
+                digest.update(name.encode("utf-8"))
+                digest.update(path.read_bytes())
+        return digest.hexdigest()
+
+    def _spec_changed(self) -> bool:
+        """Return True if the cached analysis in build/ cannot be reused."""
+        try:
+            cached = self.analysis_hash_file.read_text(encoding="utf-8")
+        except OSError:
+            return True
+        return cached.strip() != self._analysis_hash()
+
     def build(self) -> bool:
         """Execute PyInstaller build."""
         print("=== Building EXE ===")
 
         cmd = [
             sys.executable, "-m", "PyInstaller",
-            "--clean",
             "--noconfirm",
-            str(self.spec_file)
         ]
 
+        # Application modules are re-analysed by PyInstaller when they
+        # change; only a changed spec or dependency set needs a clean run
+        if self.debug or self._spec_changed():
+            cmd.append("--clean")
+        else:
+            print("  Reusing cached analysis in build/")
+
+        if self.upx_dir is not None:
+            cmd.extend(["--upx-dir", str(self.upx_dir)])
+
         if self.debug:
             cmd.append("--log-level=DEBUG")
 
+        cmd.append(str(self.spec_file))
+
         print(f"  Command: {' '.join(cmd)}")
         print()
 
-        result = subprocess.run(cmd, cwd=self.project_root)
+        # A fixed hash seed keeps PyInstaller's cached TOCs comparable
+        env = dict(os.environ, PYTHONHASHSEED="0")
+        result = subprocess.run(cmd, cwd=self.project_root, env=env)
 
         if result.returncode != 0:
             print(f"ERROR: Build failed with return code {result.returncode}")
             return False
 
+        self.build_dir.mkdir(exist_ok=True)
+        self.analysis_hash_file.write_text(self._analysis_hash(), encoding="utf-8")
+
         print()
         return True
 
@@ -218,11 +273,13 @@ def main():
                         help="Skip cleaning previous build")
     parser.add_argument("--debug", action="store_true",
                         help="Enable debug output")
+    parser.add_argument("--upx-dir", type=Path,
+                        help="Directory containing UPX (default: search PATH)")
 
     args = parser.parse_args()
 
     project_root = Path(__file__).parent.parent
-    builder = EXEBuilder(project_root, debug=args.debug)
+    builder = EXEBuilder(project_root, debug=args.debug, upx_dir=args.upx_dir)
 
     success = builder.run(clean=not args.no_clean)
     sys.exit(0 if success else 1)
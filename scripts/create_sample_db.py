@@ -3,22 +3,45 @@
 Create sample SQLite database for testing.
 
 Usage:
-    python scripts/create_sample_db.py
+    python scripts/create_sample_db.py [--orders N] [--seed SEED]
 """
 
+import argparse
 import sqlite3
 from pathlib import Path
 from datetime import datetime, timedelta
+from typing import Optional
 import random
 
+# Orders generated and inserted per executemany call
+ORDER_BATCH_SIZE = 10000
 
-def create_sample_database(db_path: Path):
-    """Create a sample SQLite database with test data."""
+
+def create_sample_database(db_path: Path, num_orders: int = 100,
+                           seed: Optional[int] = None):
+    """
+    Create a sample SQLite database with test data.
+
+    All tables and rows are written in one transaction.
+
+    Args:
+        db_path: Database file to create or extend
+        num_orders: Number of random orders to insert
+        seed: Seed for the order generator; the same seed gives the same
+            orders (dates are relative to today)
+    """
     print(f"Creating sample database: {db_path}")
 
     conn = sqlite3.connect(db_path)
+    conn.execute('PRAGMA journal_mode = WAL')
+    conn.execute('PRAGMA synchronous = NORMAL')
+    conn.execute('PRAGMA temp_store = MEMORY')
+    conn.execute('PRAGMA cache_size = -65536')  # 64 MiB
     cursor = conn.cursor()
 
+    # One transaction for the DDL and all inserts
+    cursor.execute('BEGIN IMMEDIATE')
+
     # Create users table
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS users (
@@ -106,23 +129,39 @@ def create_sample_database(db_path: Path):
     product_names = [p[0] for p in products]
     product_prices = {p[0]: p[2] for p in products}
 
-    orders = []
     base_date = datetime.now() - timedelta(days=90)
+    # Orders fall on one of 91 days; format each date once
+    order_date_texts = [
+        (base_date + timedelta(days=day_offset)).isoformat()
+        for day_offset in range(91)
+    ]
 
-    for i in range(100):
-        user_id = random.randint(1, len(users))
-        product = random.choice(product_names)
-        quantity = random.randint(1, 5)
-        price = product_prices[product] * quantity
-        order_date = base_date + timedelta(days=random.randint(0, 90))
-        status = random.choice(statuses)
-
-        orders.append((user_id, product, quantity, price, order_date.isoformat(), status))
-
-    cursor.executemany('''
-        INSERT INTO orders (user_id, product_name, quantity, price, order_date, status)
-        VALUES (?, ?, ?, ?, ?, ?)
-    ''', orders)
+    rng = random.Random(seed)
+
+    user_id_range = range(1, len(users) + 1)
+    quantity_range = range(1, 6)
+
+    for batch_start in range(0, num_orders, ORDER_BATCH_SIZE):
+        # Each field is drawn for the whole batch in one call
+        count = min(ORDER_BATCH_SIZE, num_orders - batch_start)
+        user_ids = rng.choices(user_id_range, k=count)
+        products_ordered = rng.choices(product_names, k=count)
+        quantities = rng.choices(quantity_range, k=count)
+        order_dates = rng.choices(order_date_texts, k=count)
+        order_statuses = rng.choices(statuses, k=count)
+
+        orders = [
+            (user_id, product, quantity, product_prices[product] * quantity,
+             order_date, status)
+            for user_id, product, quantity, order_date, status in zip(
+                user_ids, products_ordered, quantities, order_dates, order_statuses
+            )
+        ]
+
+        cursor.executemany('''
+            INSERT INTO orders (user_id, product_name, quantity, price, order_date, status)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', orders)
 
     # Create a view
     cursor.execute('''
@@ -142,17 +181,24 @@ def create_sample_database(db_path: Path):
 
     print(f"  Created tables: users, orders, products")
     print(f"  Created view: user_order_summary")
-    print(f"  Inserted: {len(users)} users, {len(products)} products, {len(orders)} orders")
+    print(f"  Inserted: {len(users)} users, {len(products)} products, {num_orders} orders")
     print("Done!")
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Create the sample SQLite database")
+    parser.add_argument("--orders", type=int, default=100,
+                        help="Number of random orders to insert (default: 100)")
+    parser.add_argument("--seed", type=int,
+                        help="Seed for reproducible orders (default: random)")
+    args = parser.parse_args()
+
     project_root = Path(__file__).parent.parent
     data_dir = project_root / "data" / "sample"
     data_dir.mkdir(parents=True, exist_ok=True)
 
     db_path = data_dir / "sample.db"
-    create_sample_database(db_path)
+    create_sample_database(db_path, args.orders, args.seed)
 
 
 if __name__ == "__main__":